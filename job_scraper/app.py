@@ -215,6 +215,14 @@ class Job4UApp:
             self.logger.error(f"Error deleting expired jobs: {str(e)}")
             return 0
             
+    def close(self):
+        """Release the scrapers, the pooled application browsers and the AI cover letter cache."""
+        for component in (self.scraper_manager, self.application_manager, self.ai_generator):
+            try:
+                component.close()
+            except Exception as e:
+                self.logger.error(f"Error closing {component.__class__.__name__}: {str(e)}")
+            
     def run(self):
         """Run the application with GUI interface."""
         try:
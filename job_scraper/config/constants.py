@@ -123,6 +123,26 @@ Sincerely,
         "deadline": "span.job-deadline"
     }
     
+    # Markers shown once an application has been submitted, by job source
+    SUBMIT_SELECTORS = {
+        "LinkedIn": {
+            "url_contains": "post-apply",
+            "css": "div.jobs-post-apply, h3.jpac-modal-header"
+        },
+        "Indeed": {
+            "url_contains": "post-apply",
+            "css": "div.ia-PostApply-header, h1.ia-PostApply-header"
+        },
+        "Seek": {
+            "url_contains": "/apply/success",
+            "css": "[data-automation='application-success']"
+        },
+        "generic": {
+            "url_contains": "thank",
+            "css": ".application-submitted"
+        }
+    }
+    
     # Default deadline format
     DEFAULT_DEADLINE_FORMAT = "%Y-%m-%d"
     
@@ -168,6 +188,20 @@ Limit the cover letter to approximately 350-400 words.
     PHONE_PATTERN = r"(\+\d{1,3}\s?)?(\(?\d{1,4}\)?[\s.-]?)?\d{3}[\s.-]?\d{4}"
     NAME_PATTERN = r"^([A-Z][a-z]+([\s-][A-Z][a-z]+)+)$"
     
+    # User input validation patterns, matched against the whole input
+    PATTERNS = {
+        "email": EMAIL_PATTERN,
+        "phone": r"\+?(?=(?:\D*\d){7})[\d\s().-]{7,20}",  # at least 7 digits
+        "name": NAME_PATTERN,
+        "api_key": r"sk-[a-zA-Z0-9]{32,}"
+    }
+    
+    # Accepted file extensions (lowercase, with the leading dot)
+    FILE_EXTENSIONS = {
+        "RESUME": frozenset({".pdf", ".docx", ".doc", ".txt"}),
+        "COVER_LETTER": frozenset({".txt"})
+    }
+    
     # Database tables
     DB_TABLES = {
         "jobs": """
@@ -230,6 +264,7 @@ Limit the cover letter to approximately 350-400 words.
     
     # Log file for applications
     APPLICATIONS_LOG = f"{OUTPUT_DIR}/applications.json"
+    APPLICATIONS_DB = f"{OUTPUT_DIR}/applications.db"
     
     # Database configuration
     DB_NAME = "job_scraper.db"
@@ -2,17 +2,17 @@ import logging
 import re
 import math
 import threading
-import multiprocessing
 from typing import List, Dict, Any, Set, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import Counter
 
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ..config.constants import Constants
 
+# Maximum number of job descriptions whose extracted skills are kept
+SKILL_CACHE_SIZE = 10000
+
 class JobMatcher:
     """Match jobs with resume data using optimized text comparison."""
     
@@ -26,15 +26,26 @@ class JobMatcher:
         """
         self.logger = logger or logging.getLogger(__name__)
         self.resume_settings = resume_settings
-        self.num_threads = min(8, (multiprocessing.cpu_count() or 4) - 1)
+        # Single precision halves the memory the job vectors and scoring touch
         self.vectorizer = TfidfVectorizer(
             stop_words='english',
             ngram_range=(1, 2),
             max_features=10000,
-            sublinear_tf=True
+            sublinear_tf=True,
+            dtype=np.float32
         )
         self.skill_pattern = re.compile(r'\b(' + '|'.join(re.escape(s.lower()) for s in self.get_common_skills()) + r')\b')
         
+        # TF-IDF state reused across match_jobs calls
+        self._tfidf_lock = threading.Lock()
+        self._corpus = None
+        self._job_vectors = None
+        self._resume_text = None
+        self._resume_vector = None
+        
+        # Skills found in each job description, reused across match_jobs calls
+        self._skill_cache: Dict[str, frozenset] = {}
+        
     def get_common_skills(self) -> List[str]:
         """
         Get a list of common tech skills to look for.
@@ -80,6 +91,24 @@ class JobMatcher:
         matches = self.skill_pattern.findall(text)
         return set(matches)
         
+    def _job_skills(self, description: str) -> frozenset:
+        """
+        Extract skills from a job description, reusing earlier results.
+        
+        Args:
+            description: Job description
+            
+        Returns:
+            Frozen set of skills found in the description
+        """
+        skills = self._skill_cache.get(description)
+        if skills is None:
+            if len(self._skill_cache) >= SKILL_CACHE_SIZE:
+                self._skill_cache.clear()
+            skills = frozenset(self.extract_skills(description))
+            self._skill_cache[description] = skills
+        return skills
+        
     def match_jobs(self, resume_data: Dict[str, Any], jobs: List[Dict[str, Any]], 
                   top_n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -109,31 +138,18 @@ class JobMatcher:
         # Create resume text for TF-IDF
         resume_text = self._prepare_resume_text(resume_data)
         
-        # Batch jobs for parallel processing
-        batch_size = max(1, len(jobs) // self.num_threads)
-        batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
-        
-        # Process batches in parallel
-        matched_jobs = []
-        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            future_to_batch = {
-                executor.submit(self._process_batch, resume_text, resume_skills, batch): i 
-                for i, batch in enumerate(batches)
-            }
+        # Score every job against the resume in one sparse product
+        descriptions = tuple(job.get('description') or '' for job in jobs)
+        try:
+            job_vectors, resume_vector = self._vectorize(descriptions, resume_text)
+            # TF-IDF rows are L2-normalised, so the dot product is the cosine similarity
+            similarities = (job_vectors @ resume_vector.T).toarray().ravel()
+        except ValueError as e:
+            # Raised when the descriptions contain no usable terms
+            self.logger.error(f"Error vectorizing job descriptions: {str(e)}")
+            similarities = np.zeros(len(jobs), dtype=np.float32)
             
-            for future in as_completed(future_to_batch):
-                batch_idx = future_to_batch[future]
-                try:
-                    batch_results = future.result()
-                    matched_jobs.extend(batch_results)
-                except Exception as e:
-                    self.logger.error(f"Error processing batch {batch_idx}: {str(e)}")
-                    
-        # Sort by match percentage descending
-        matched_jobs.sort(key=lambda x: x.get('match_percentage', 0), reverse=True)
-        
-        # Return top N
-        result = matched_jobs[:top_n] if top_n > 0 else matched_jobs
+        result = self._score_jobs(jobs, similarities, resume_skills, top_n)
         self.logger.info(f"Returned {len(result)} matched jobs")
         return result
         
@@ -169,54 +185,89 @@ class JobMatcher:
                 
         return ' '.join(parts)
         
-    def _process_batch(self, resume_text: str, resume_skills: Set[str], 
-                    jobs_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _vectorize(self, descriptions: Tuple[str, ...], resume_text: str):
         """
-        Process a batch of jobs for matching.
+        Get TF-IDF vectors for the job descriptions and the resume.
+        
+        The vectorizer is fitted once per set of descriptions and the resume
+        is transformed once per resume text, so matching the same listings
+        again, or against another resume, skips the refit.
         
         Args:
+            descriptions: Job descriptions
             resume_text: Prepared resume text
-            resume_skills: Set of resume skills
-            jobs_batch: Batch of jobs to process
             
         Returns:
-            List of processed jobs with match scores
+            Tuple of the job vector matrix and the resume vector
         """
-        result = []
+        with self._tfidf_lock:
+            if descriptions != self._corpus:
+                self._job_vectors = self.vectorizer.fit_transform(descriptions)
+                self._corpus = descriptions
+                self._resume_text = None
+                
+            if resume_text != self._resume_text:
+                self._resume_vector = self.vectorizer.transform([resume_text])
+                self._resume_text = resume_text
+                
+            return self._job_vectors, self._resume_vector
         
-        # Prepare job descriptions for vectorization
-        job_descriptions = [job.get('description', '') for job in jobs_batch]
-        job_descriptions.append(resume_text)  # Add resume text as last document
+    @staticmethod
+    def _top_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Get the indices of the highest scores, best first.
         
-        # TF-IDF vectorization
-        tfidf_matrix = self.vectorizer.fit_transform(job_descriptions)
+        Uses a partial sort when only the top few of many scores are needed.
         
-        # Calculate similarity between resume and each job
-        resume_vector = tfidf_matrix[-1]  # Last vector is the resume
-        job_vectors = tfidf_matrix[:-1]    # All except the last are jobs
+        Args:
+            scores: Match scores
+            top_n: Number of indices to return, or 0 or less for all
+            
+        Returns:
+            Indices into scores ordered by descending score
+        """
+        if 0 < top_n < len(scores):
+            indices = np.argpartition(-scores, top_n - 1)[:top_n]
+        else:
+            indices = np.arange(len(scores))
+        return indices[np.argsort(-scores[indices], kind='stable')]
         
-        # Calculate cosine similarities
-        similarities = cosine_similarity(job_vectors, resume_vector)
+    def _score_jobs(self, jobs: List[Dict[str, Any]], similarities: np.ndarray,
+                    resume_skills: Set[str], top_n: int) -> List[Dict[str, Any]]:
+        """
+        Combine text similarity and skill overlap into match scores.
         
-        # Process each job
-        for i, job in enumerate(jobs_batch):
-            sim_score = similarities[i][0]
-            job_copy = job.copy()
-            
-            # Extract skills from job description
-            job_skills = self.extract_skills(job.get('description', ''))
-            
-            # Calculate skill match percentage
-            missing_skills = job_skills - resume_skills
-            matching_skills = job_skills & resume_skills
+        Args:
+            jobs: Jobs to score
+            similarities: Cosine similarity of each job to the resume
+            resume_skills: Set of resume skills
+            top_n: Number of top matches to return, or 0 or less for all
             
-            skill_match_pct = 0
-            if job_skills:
-                skill_match_pct = len(matching_skills) / len(job_skills) * 100
-                
-            # Calculate match percentage - weighted combination of skill match and text similarity
-            text_sim_pct = sim_score * 100
-            match_percentage = (skill_match_pct * 0.7) + (text_sim_pct * 0.3)
+        Returns:
+            List of copied top jobs with match scores, best match first
+        """
+        # Extract skills from job descriptions
+        job_skills = [self._job_skills(job.get('description') or '') for job in jobs]
+        
+        # Calculate skill match percentage
+        skill_match = np.array([
+            len(skills & resume_skills) / len(skills) * 100 if skills else 0.0
+            for skills in job_skills
+        ], dtype=np.float32)
+        
+        # Calculate match percentage - weighted combination of skill match and text similarity
+        text_sim = similarities * 100
+        match_scores = (skill_match * 0.7) + (text_sim * 0.3)
+        
+        # Only the selected jobs are copied and annotated
+        result = []
+        for i in self._top_indices(match_scores, top_n).tolist():
+            job_copy = jobs[i].copy()
+            matching_skills = job_skills[i] & resume_skills
+            missing_skills = job_skills[i] - resume_skills
+            match_percentage = float(match_scores[i])
+            text_sim_pct = float(text_sim[i])
+            skill_match_pct = float(skill_match[i])
             
             # Add match info to job
             job_copy['match_percentage'] = round(match_percentage, 2)
@@ -2,15 +2,38 @@ import os
 import sqlite3
 import logging
 import threading
-import queue
 import time
+import weakref
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from job_scraper.config.constants import Constants
 
+# Columns of the jobs table except the description, for listing many jobs
+_JOB_SUMMARY_COLUMNS = ("id, title, company, location, url, source, deadline, date_scraped, "
+                        "expired, applied, application_date, match_score")
+
+class _IdleConnections(list):
+    """Idle connections kept by one thread, compared by identity."""
+    
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+class _ThreadConnections(threading.local):
+    """Per-thread pool state, set up the first time a thread uses the pool."""
+    
+    def __init__(self, registry, lock):
+        self.idle = _IdleConnections()
+        with lock:
+            registry.add(self.idle)
+
 class ConnectionPool:
-    """Connection pool for SQLite connections."""
+    """Connection pool for SQLite connections.
+    
+    Each thread reuses its own idle connections, so worker threads keep
+    their connections between queries and a connection is never handed
+    to a thread other than the one using it.
+    """
     
     def __init__(self, db_path: str, max_connections: int = 5):
         """
@@ -18,14 +41,15 @@ class ConnectionPool:
         
         Args:
             db_path: Path to SQLite database file
-            max_connections: Maximum number of connections to maintain
+            max_connections: Maximum number of idle connections kept per thread
         """
         self.db_path = db_path
         self.max_connections = max_connections
-        self.connections = queue.Queue(maxsize=max_connections)
-        self.connections_created = 0
         self.lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
+        # Idle lists of live threads; a thread's list and connections go with it
+        self._idle_lists = weakref.WeakSet()
+        self._local = _ThreadConnections(self._idle_lists, self.lock)
         
     def get_connection(self) -> sqlite3.Connection:
         """
@@ -34,20 +58,11 @@ class ConnectionPool:
         Returns:
             SQLite connection
         """
-        try:
-            # Try to get an existing connection
-            return self.connections.get(block=False)
-        except queue.Empty:
-            # Create a new connection if under the limit
-            with self.lock:
-                if self.connections_created < self.max_connections:
-                    conn = self._create_connection()
-                    self.connections_created += 1
-                    return conn
-                    
-            # Wait for a connection to be returned to the pool
-            self.logger.debug("Connection pool exhausted, waiting for a connection")
-            return self.connections.get()
+        idle = self._local.idle
+        if idle:
+            # Reuse a connection this thread returned earlier
+            return idle.pop()
+        return self._create_connection()
             
     def return_connection(self, conn: sqlite3.Connection):
         """
@@ -56,13 +71,12 @@ class ConnectionPool:
         Args:
             conn: SQLite connection to return
         """
-        try:
-            self.connections.put(conn, block=False)
-        except queue.Full:
-            # Close the connection if the pool is full
+        idle = self._local.idle
+        if len(idle) < self.max_connections:
+            idle.append(conn)
+        else:
+            # Close the connection if the thread already keeps enough
             conn.close()
-            with self.lock:
-                self.connections_created -= 1
                 
     def _create_connection(self) -> sqlite3.Connection:
         """
@@ -71,7 +85,8 @@ class ConnectionPool:
         Returns:
             New SQLite connection
         """
-        conn = sqlite3.connect(self.db_path)
+        # Connections stay on one thread; close_all may close them from another
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
         # Configure connection for better performance
@@ -83,17 +98,18 @@ class ConnectionPool:
         return conn
         
     def close_all(self):
-        """Close all connections in the pool."""
+        """Close the idle connections of all threads."""
         with self.lock:
-            while not self.connections.empty():
+            idle_lists = list(self._idle_lists)
+            
+        for idle in idle_lists:
+            while idle:
                 try:
-                    conn = self.connections.get(block=False)
-                    conn.close()
-                except queue.Empty:
+                    idle.pop().close()
+                except IndexError:
                     break
                 except Exception as e:
                     self.logger.error(f"Error closing connection: {str(e)}")
-            self.connections_created = 0
 
 class DatabaseManager:
     """Manager for database operations with optimized queries and connection pooling."""
@@ -258,65 +274,126 @@ class DatabaseManager:
         self.logger.debug(f"Adding {len(jobs)} jobs in batch")
         conn = self.connection_pool.get_connection()
         try:
-            cursor = conn.cursor()
-            count = 0
-            
-            # Begin transaction
-            conn.execute("BEGIN TRANSACTION")
-            
-            for job_data in jobs:
-                title = job_data.get('title', '')
-                company = job_data.get('company', '')
-                location = job_data.get('location', '')
-                description = job_data.get('description', '')
-                url = job_data.get('url', '')
-                source = job_data.get('source', '')
-                deadline = job_data.get('deadline', None)
-                match_percentage = job_data.get('match_percentage', None)
-                
-                # Check if job already exists
-                cursor.execute(
-                    "SELECT id FROM jobs WHERE url = ?",
-                    (url,)
-                )
-                existing_job = cursor.fetchone()
-                
-                if existing_job:
-                    job_id = existing_job['id']
-                    
-                    # Update existing job with new data
-                    cursor.execute(
-                        """
-                        UPDATE jobs SET 
-                            title = ?, company = ?, location = ?, description = ?,
-                            source = ?, deadline = ?, match_percentage = ?
-                        WHERE id = ?
-                        """,
-                        (title, company, location, description, source, deadline, match_percentage, job_id)
-                    )
-                else:
-                    # Insert new job
-                    cursor.execute(
-                        """
-                        INSERT INTO jobs 
-                        (title, company, location, description, url, source, date_scraped, deadline, match_percentage)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (title, company, location, description, url, source, 
-                         datetime.now().isoformat(), deadline, match_percentage)
-                    )
-                    count += 1
-                    
-            conn.commit()
+            with conn:
+                _, count = self._upsert_jobs(conn, jobs)
             self.logger.debug(f"Added {count} new jobs in batch")
             return count
         except Exception as e:
             self.logger.error(f"Error adding jobs batch: {str(e)}")
-            conn.rollback()
             return 0
         finally:
             self.connection_pool.return_connection(conn)
             
+    def insert_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert or update multiple jobs in a single transaction.
+        
+        Args:
+            jobs: List of job data dictionaries
+            
+        Returns:
+            Job IDs in the same order as ``jobs``, or an empty list on error
+        """
+        if not jobs:
+            return []
+            
+        self.logger.debug(f"Inserting {len(jobs)} jobs in bulk")
+        conn = self.connection_pool.get_connection()
+        try:
+            with conn:
+                job_ids, count = self._upsert_jobs(conn, jobs)
+            self.logger.debug(f"Inserted {count} new jobs in bulk")
+            return job_ids
+        except Exception as e:
+            self.logger.error(f"Error inserting jobs in bulk: {str(e)}")
+            return []
+        finally:
+            self.connection_pool.return_connection(conn)
+            
+    def _upsert_jobs(self, conn: sqlite3.Connection, jobs: List[Dict[str, Any]]) -> Tuple[List[int], int]:
+        """
+        Insert new jobs and update existing ones (matched by URL) with executemany.
+        
+        Match scores are left alone: new jobs get the column default and
+        updates keep the existing score.
+        
+        Args:
+            conn: SQLite connection with an open transaction
+            jobs: List of job data dictionaries
+            
+        Returns:
+            Tuple of (job IDs in the same order as ``jobs``, number of new jobs)
+        """
+        rows = [
+            (
+                job_data.get('title', ''),
+                job_data.get('company', ''),
+                job_data.get('location', ''),
+                job_data.get('description', ''),
+                job_data.get('url', ''),
+                job_data.get('source', ''),
+                job_data.get('deadline', None)
+            )
+            for job_data in jobs
+        ]
+        urls = list(dict.fromkeys(row[4] for row in rows))
+        url_ids = self._get_job_ids_by_url(conn, urls)
+        
+        # Insert the first occurrence of each unseen URL, the rest become updates
+        new_rows = {}
+        update_rows = []
+        for row in rows:
+            if row[4] in url_ids or row[4] in new_rows:
+                update_rows.append(row)
+            else:
+                new_rows[row[4]] = row
+                
+        date_scraped = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO jobs 
+            (title, company, location, description, url, source, date_scraped, deadline)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [row[:6] + (date_scraped,) + row[6:] for row in new_rows.values()]
+        )
+        if new_rows:
+            url_ids.update(self._get_job_ids_by_url(conn, list(new_rows)))
+        
+        # Update existing jobs with new data
+        conn.executemany(
+            """
+            UPDATE jobs SET 
+                title = ?, company = ?, location = ?, description = ?,
+                source = ?, deadline = ?
+            WHERE id = ?
+            """,
+            [row[:4] + row[5:] + (url_ids[row[4]],) for row in update_rows]
+        )
+        
+        return [url_ids[row[4]] for row in rows], len(new_rows)
+        
+    def _get_job_ids_by_url(self, conn: sqlite3.Connection, urls: List[str]) -> Dict[str, int]:
+        """
+        Look up job IDs for the given URLs.
+        
+        Args:
+            conn: SQLite connection
+            urls: URLs to look up
+            
+        Returns:
+            Dictionary mapping URL to job ID for jobs that exist
+        """
+        url_ids = {}
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = conn.execute(f"SELECT id, url FROM jobs WHERE url IN ({placeholders})", chunk)
+            for row in cursor.fetchall():
+                url_ids.setdefault(row['url'], row['id'])
+        return url_ids
+            
     def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a job by ID.
@@ -350,7 +427,8 @@ class DatabaseManager:
                 applied: Optional[bool] = None,
                 limit: int = 100, 
                 offset: int = 0,
-                order_by: str = "date_scraped DESC") -> Tuple[List[Dict[str, Any]], int]:
+                order_by: str = "date_scraped DESC",
+                with_description: bool = True) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get jobs with pagination and filtering.
         
@@ -362,6 +440,8 @@ class DatabaseManager:
             limit: Maximum number of jobs to return
             offset: Offset for pagination
             order_by: Column and direction to sort by
+            with_description: Whether to include job descriptions; leaving
+                them out keeps large job lists small
             
         Returns:
             Tuple of (list of jobs, total count)
@@ -372,7 +452,8 @@ class DatabaseManager:
             cursor = conn.cursor()
             
             # Build query with filters
-            query = "SELECT * FROM jobs WHERE 1=1"
+            columns = "*" if with_description else _JOB_SUMMARY_COLUMNS
+            query = f"SELECT {columns} FROM jobs WHERE 1=1"
             count_query = "SELECT COUNT(*) FROM jobs WHERE 1=1"
             params = []
             
@@ -414,6 +495,55 @@ class DatabaseManager:
         finally:
             self.connection_pool.return_connection(conn)
             
+    def iter_jobs(self,
+                  status: Optional[str] = None,
+                  min_match: Optional[float] = None,
+                  page_size: int = 500,
+                  order_by: str = "date_scraped DESC",
+                  with_description: bool = True) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over jobs in pages.
+        
+        Pages are read from a single query as they are consumed, so the
+        first page is available without reading the whole table or
+        re-running the query for every page.
+        
+        Args:
+            status: Filter by job status
+            min_match: Minimum match percentage
+            page_size: Maximum number of jobs per page
+            order_by: Column and direction to sort by
+            with_description: Whether to include job descriptions
+            
+        Yields:
+            Lists of up to page_size job dictionaries
+        """
+        conn = self.connection_pool.get_connection()
+        try:
+            columns = "*" if with_description else _JOB_SUMMARY_COLUMNS
+            query = f"SELECT {columns} FROM jobs WHERE 1=1"
+            params = []
+            
+            if status:
+                query += " AND expired = ?"
+                params.append(status)
+                
+            if min_match is not None:
+                query += " AND match_score >= ?"
+                params.append(min_match)
+                
+            cursor = conn.execute(query + f" ORDER BY {order_by}", params)
+            
+            while True:
+                rows = cursor.fetchmany(page_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error iterating jobs: {str(e)}")
+        finally:
+            self.connection_pool.return_connection(conn)
+            
     def update_job_status(self, job_id: int, status: str) -> bool:
         """
         Update a job's status.
@@ -485,17 +615,19 @@ class DatabaseManager:
         try:
             cursor = conn.cursor()
             
-            # Get total counts by match category
+            # Get counts by match category and by status in one scan
             cursor.execute(
                 """
                 SELECT
-                    COUNT(*) as total,
+                    COUNT(match_score) as total,
                     SUM(CASE WHEN match_score >= ? THEN 1 ELSE 0 END) as excellent,
                     SUM(CASE WHEN match_score >= ? AND match_score < ? THEN 1 ELSE 0 END) as good,
                     SUM(CASE WHEN match_score >= ? AND match_score < ? THEN 1 ELSE 0 END) as fair,
-                    SUM(CASE WHEN match_score < ? THEN 1 ELSE 0 END) as poor
+                    SUM(CASE WHEN match_score < ? THEN 1 ELSE 0 END) as poor,
+                    SUM(CASE WHEN expired = 0 THEN 1 ELSE 0 END) as active,
+                    SUM(CASE WHEN expired = 1 THEN 1 ELSE 0 END) as expired,
+                    SUM(CASE WHEN applied = 1 THEN 1 ELSE 0 END) as applied
                 FROM jobs
-                WHERE match_score IS NOT NULL
                 """,
                 (
                     Constants.MATCH_THRESHOLDS["EXCELLENT"],
@@ -507,17 +639,9 @@ class DatabaseManager:
             
             result = dict(cursor.fetchone())
             
-            # Get counts by status
-            cursor.execute(
-                """
-                SELECT expired, COUNT(*) as count
-                FROM jobs
-                GROUP BY expired
-                """
-            )
-            
-            status_counts = {row['expired']: row['count'] for row in cursor.fetchall()}
-            result['status_counts'] = status_counts
+            # Counts keyed by the expired flag, for statuses that have jobs
+            status_counts = {0: result['active'], 1: result['expired']}
+            result['status_counts'] = {status: count for status, count in status_counts.items() if count}
             
             return result
         except Exception as e:
@@ -7,12 +7,19 @@ import os
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QPushButton, QGroupBox, QFormLayout,
                             QComboBox, QSpinBox, QProgressBar, QMessageBox,
-                            QFileDialog, QTextEdit, QTableWidget, QTableWidgetItem,
+                            QFileDialog, QTextEdit, QTableView, QAbstractItemView,
                             QHeaderView, QCheckBox, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 
+from job_scraper.gui.models import JobTableModel
 from job_scraper.gui.workers import ApplyToJobWorker
 
+# Number of generated cover letters kept for re-selected jobs
+COVER_LETTER_CACHE_SIZE = 256
+
+# Delay before re-filtering, so a burst of filter changes filters once
+FILTER_DELAY_MS = 50
+
 class ApplicationTab:
     """Class to handle the job application tab functionality."""
     
@@ -26,6 +33,11 @@ class ApplicationTab:
         self.parent = parent
         self.app = app
         self.tab = QWidget()
+        self.jobs = None
+        self.selected_job = None
+        self.cover_letter = None
+        self._cover_letter_cache = {}
+        self._cover_letter_cache_resume = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -51,7 +63,6 @@ class ApplicationTab:
         filter_layout.addWidget(QLabel("Status:"))
         self.status_combo = QComboBox()
         self.status_combo.addItems(["All Jobs", "Matched Jobs", "Not Applied"])
-        self.status_combo.currentIndexChanged.connect(self.filter_jobs)
         filter_layout.addWidget(self.status_combo)
         
         filter_layout.addWidget(QLabel("Min Match:"))
@@ -59,9 +70,16 @@ class ApplicationTab:
         self.match_threshold.setRange(0, 100)
         self.match_threshold.setValue(60)
         self.match_threshold.setSuffix("%")
-        self.match_threshold.valueChanged.connect(self.filter_jobs)
         filter_layout.addWidget(self.match_threshold)
         
+        # Typing or stepping through thresholds restarts the timer each time
+        self._filter_timer = QTimer(self.parent)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.filter_jobs)
+        self.status_combo.currentIndexChanged.connect(lambda: self._filter_timer.start())
+        self.match_threshold.valueChanged.connect(lambda: self._filter_timer.start())
+        
         filter_layout.addStretch()
         
         # Refresh button
@@ -72,15 +90,22 @@ class ApplicationTab:
         job_selection_layout.addLayout(filter_layout)
         
         # Jobs table
-        self.jobs_table = QTableWidget()
-        self.jobs_table.setColumnCount(6)
-        self.jobs_table.setHorizontalHeaderLabels(["ID", "Title", "Company", "Location", "Match %", "Deadline"])
+        self.jobs_model = JobTableModel([
+            ("ID", 'id', None),
+            ("Title", 'title', None),
+            ("Company", 'company', None),
+            ("Location", 'location', None),
+            ("Match %", 'match_score', lambda score: f"{score or 0}%"),
+            ("Deadline", 'deadline', lambda deadline: deadline or 'Not specified')
+        ], score_column=4, parent=self.tab)
+        self.jobs_table = QTableView()
+        self.jobs_table.setModel(self.jobs_model)
         self.jobs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # Stretch the Title column
         self.jobs_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Stretch the Company column
-        self.jobs_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.jobs_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.jobs_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-        self.jobs_table.itemSelectionChanged.connect(self.job_selected)
+        self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.jobs_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.jobs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Read-only
+        self.jobs_table.selectionModel().selectionChanged.connect(self.job_selected)
         job_selection_layout.addWidget(self.jobs_table)
         
         top_layout.addWidget(job_selection_group)
@@ -197,29 +222,26 @@ class ApplicationTab:
     
     def filter_jobs(self):
         """Filter jobs based on selected criteria."""
-        if not hasattr(self, 'jobs'):
+        if self.jobs is None:
             return
         
-        filtered_jobs = []
         status_filter = self.status_combo.currentText()
         match_threshold = self.match_threshold.value()
         
-        for job in self.jobs:
-            match_score = job.get('match_score', 0)
+        # Resolve the status filter once instead of comparing it per job
+        require_match = status_filter == "Matched Jobs"
+        skip_applied = status_filter == "Not Applied"
+        
+        def passes(job):
+            match_score = job.get('match_score') or 0
             
             # Skip jobs below match threshold
-            if match_score < match_threshold:
-                continue
+            if match_score < match_threshold or (require_match and match_score == 0):
+                return False
             
-            # Apply status filter
-            if status_filter == "Matched Jobs" and match_score == 0:
-                continue
-            elif status_filter == "Not Applied" and job.get('applied', False):
-                continue
-            
-            filtered_jobs.append(job)
+            return not (skip_applied and job.get('applied', False))
         
-        self.display_jobs(filtered_jobs)
+        self.display_jobs(list(filter(passes, self.jobs)))
     
     def display_jobs(self, jobs):
         """Display filtered jobs in the jobs table.
@@ -227,61 +249,20 @@ class ApplicationTab:
         Args:
             jobs: List of job dictionaries to display
         """
-        self.jobs_table.setRowCount(0)  # Clear table
-        
-        for job in jobs:
-            row = self.jobs_table.rowCount()
-            self.jobs_table.insertRow(row)
-            
-            # ID
-            id_item = QTableWidgetItem(str(job.get('id', '')))
-            self.jobs_table.setItem(row, 0, id_item)
-            
-            # Title
-            title_item = QTableWidgetItem(job.get('title', ''))
-            self.jobs_table.setItem(row, 1, title_item)
-            
-            # Company
-            company_item = QTableWidgetItem(job.get('company', ''))
-            self.jobs_table.setItem(row, 2, company_item)
-            
-            # Location
-            location_item = QTableWidgetItem(job.get('location', ''))
-            self.jobs_table.setItem(row, 3, location_item)
-            
-            # Match %
-            match_score = job.get('match_score', 0)
-            match_item = QTableWidgetItem(f"{match_score}%")
-            self.jobs_table.setItem(row, 4, match_item)
-            
-            # Color code based on match score
-            if match_score >= 80:
-                match_item.setBackground(Qt.green)
-            elif match_score >= 60:
-                match_item.setBackground(Qt.yellow)
-            elif match_score > 0:
-                match_item.setBackground(Qt.lightGray)
-            
-            # Deadline
-            deadline_item = QTableWidgetItem(job.get('deadline', 'Not specified'))
-            self.jobs_table.setItem(row, 5, deadline_item)
-            
-            # Store the job data in first column item
-            id_item.setData(Qt.UserRole, job)
+        # The model renders cells on demand, so this is a single reset
+        self.jobs_model.set_jobs(jobs)
         
         self.parent.logger.info(f"Displayed {len(jobs)} jobs in application tab")
     
     def job_selected(self):
         """Handle job selection event."""
-        selected_items = self.jobs_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.jobs_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.preview_button.setEnabled(False)
             return
         
-        # Get the job data from the first cell of the selected row
-        row = selected_items[0].row()
-        job_item = self.jobs_table.item(row, 0)
-        self.selected_job = job_item.data(Qt.UserRole)
+        # Get the job data for the selected row
+        self.selected_job = self.jobs_model.job_at(selected_rows[0].row())
         
         self.parent.logger.info(f"Selected job: {self.selected_job.get('title')} at {self.selected_job.get('company')}")
         
@@ -310,7 +291,7 @@ class ApplicationTab:
     
     def preview_cover_letter(self):
         """Generate and preview the cover letter for the selected job."""
-        if not hasattr(self, 'selected_job'):
+        if self.selected_job is None:
             QMessageBox.warning(self.parent, "Warning", "Please select a job first.")
             return
         
@@ -355,10 +336,17 @@ class ApplicationTab:
                     # Fall back to basic template
                     use_ai = False
             
+            # Reuse the letter from an earlier preview of the same job and template
+            cache_key = self._cover_letter_cache_key(template_path, use_ai, resume_data)
+            cached_letter = self._cover_letter_cache.get(cache_key)
+            
             # Generate cover letter
             job_description = self.selected_job.get('description', '')
             
-            if use_ai:
+            if cached_letter is not None:
+                self.parent.logger.info("Using previously generated cover letter")
+                self.cover_letter = cached_letter
+            elif use_ai:
                 self.parent.logger.info("Generating AI cover letter")
                 self.cover_letter = self.app.application_manager.generate_cover_letter(
                     resume_data, 
@@ -373,6 +361,12 @@ class ApplicationTab:
                     template_path
                 )
             
+            if cached_letter is None:
+                if len(self._cover_letter_cache) >= COVER_LETTER_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._cover_letter_cache[next(iter(self._cover_letter_cache))]
+                self._cover_letter_cache[cache_key] = self.cover_letter
+            
             # Display preview
             self.cl_preview.setText(self.cover_letter)
             
@@ -390,9 +384,36 @@ class ApplicationTab:
             self.progress_bar.setValue(0)
             QMessageBox.critical(self.parent, "Error", f"Error generating cover letter: {str(e)}")
     
+    def _cover_letter_cache_key(self, template_path, use_ai, resume_data):
+        """Build the cache key for the selected job's cover letter.
+        
+        The key includes the template's modification time so edits to the
+        template are picked up. Loading a different resume clears the cache.
+        
+        Args:
+            template_path (str): Path to the cover letter template
+            use_ai (bool): Whether the letter is generated by AI
+            resume_data (dict): Parsed resume the letter is written from
+            
+        Returns:
+            tuple: Cache key
+        """
+        if resume_data is not self._cover_letter_cache_resume:
+            self._cover_letter_cache.clear()
+            self._cover_letter_cache_resume = resume_data
+            
+        try:
+            template_mtime = os.path.getmtime(template_path)
+        except OSError:
+            template_mtime = None
+            
+        job = self.selected_job
+        job_key = job.get('id') or (job.get('title'), job.get('company'))
+        return (template_path, template_mtime, use_ai, job_key)
+    
     def save_cover_letter(self):
         """Save the generated cover letter to a file."""
-        if not hasattr(self, 'cover_letter'):
+        if self.cover_letter is None:
             QMessageBox.warning(self.parent, "Warning", "No cover letter has been generated.")
             return
         
@@ -430,11 +451,11 @@ class ApplicationTab:
     
     def apply_to_job(self):
         """Apply to the selected job."""
-        if not hasattr(self, 'cover_letter'):
+        if self.cover_letter is None:
             QMessageBox.warning(self.parent, "Warning", "No cover letter has been generated.")
             return
         
-        if not hasattr(self, 'selected_job'):
+        if self.selected_job is None:
             QMessageBox.warning(self.parent, "Warning", "Please select a job first.")
             return
         
@@ -13,6 +13,7 @@ from PyQt5.QtWidgets import (
 
 from job_scraper.gui.workers import LoadJobsWorker, ApplyToJobWorker, CheckExpiredJobsWorker, DeleteExpiredJobsWorker
 from job_scraper.gui.dialogs import JobDetailsDialog, CoverLetterDialog
+from job_scraper.gui.ui_helpers import batch_table_update
 from job_scraper.config.constants import Constants
 
 
@@ -26,6 +27,7 @@ class ApplicationsTab(QWidget):
         self.logger = logging.getLogger(__name__)
         self.worker = None
         self.jobs = []
+        self._jobs_by_id = {}
         
         self._setup_ui()
         
@@ -162,6 +164,7 @@ class ApplicationsTab(QWidget):
         # Clear previous results
         self.jobs_table.setRowCount(0)
         self.jobs = []
+        self._jobs_by_id = {}
         
         # Update UI
         self.status_label.setText("Loading jobs...")
@@ -180,7 +183,7 @@ class ApplicationsTab(QWidget):
             )
             
             self.worker.progress.connect(self.update_progress)
-            self.worker.job_loaded.connect(self.add_job)
+            self.worker.jobs_loaded.connect(self.add_jobs)
             self.worker.completed.connect(self.loading_completed)
             self.worker.error.connect(self.show_error)
             
@@ -199,7 +202,18 @@ class ApplicationsTab(QWidget):
         """
         self.status_label.setText(message)
         
-    @pyqtSlot(dict)
+    @pyqtSlot(list)
+    def add_jobs(self, jobs):
+        """Add a batch of jobs to the table.
+        
+        Args:
+            jobs: List of job data dictionaries
+        """
+        # Sort and repaint once for the whole batch rather than once per row
+        with batch_table_update(self.jobs_table):
+            for job in jobs:
+                self.add_job(job)
+            
     def add_job(self, job):
         """Add a job to the table.
         
@@ -208,6 +222,7 @@ class ApplicationsTab(QWidget):
         """
         # Store job data
         self.jobs.append(job)
+        self._jobs_by_id[job.get('id')] = job
         
         # Add to table
         row = self.jobs_table.rowCount()
@@ -285,12 +300,7 @@ class ApplicationsTab(QWidget):
         row = selected_items[0].row()
         job_id = self.jobs_table.item(row, 0).data(Qt.UserRole)
         
-        # Find the job in the jobs list
-        for job in self.jobs:
-            if job.get('id') == job_id:
-                return job
-                
-        return None
+        return self._jobs_by_id.get(job_id)
         
     def view_selected_job(self):
         """View details of the selected job."""
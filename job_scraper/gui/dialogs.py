@@ -4,6 +4,7 @@ Dialog windows for the job scraper GUI.
 """
 
 import os
+import re
 import sys
 import logging
 from typing import List, Dict, Any, Optional
@@ -20,6 +21,9 @@ from PyQt5.QtWidgets import (
 from job_scraper.config.constants import Constants
 from job_scraper.gui.workers import GenerateAICoverLetterWorker
 
+# Placeholders of the default cover letter template filled from resume and job data
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r'\[(YOUR_NAME|YOUR_EMAIL|YOUR_PHONE|COMPANY_NAME|JOB_TITLE)\]')
+
 
 class CoverLetterDialog(QDialog):
     """Dialog for generating and editing cover letters."""
@@ -135,17 +139,19 @@ class CoverLetterDialog(QDialog):
             template = Constants.DEFAULT_COVER_LETTER_TEMPLATE
             
             # Fill in template with resume and job data
-            name = self.resume_data.get('name', '[Your Name]')
-            email = self.resume_data.get('email', '[Your Email]')
-            phone = self.resume_data.get('phone', '[Your Phone]')
-            company = self.job_data.get('company', '[Company Name]')
-            job_title = self.job_data.get('title', '[Job Title]')
+            values = {
+                'YOUR_NAME': self.resume_data.get('name'),
+                'YOUR_EMAIL': self.resume_data.get('email'),
+                'YOUR_PHONE': self.resume_data.get('phone'),
+                'COMPANY_NAME': self.job_data.get('company'),
+                'JOB_TITLE': self.job_data.get('title')
+            }
             
-            template = template.replace('[Your Name]', name)
-            template = template.replace('[Your Email]', email)
-            template = template.replace('[Your Phone]', phone)
-            template = template.replace('[Company Name]', company)
-            template = template.replace('[Job Title]', job_title)
+            # Replace every placeholder in one pass, leaving unknown values in place
+            template = _TEMPLATE_PLACEHOLDER_RE.sub(
+                lambda match: values[match.group(1)] or match.group(0),
+                template
+            )
             
             self.cover_letter_edit.setPlainText(template)
             
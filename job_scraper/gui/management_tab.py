@@ -4,15 +4,17 @@ Management tab for the job scraper GUI application.
 """
 
 import os
+from collections import defaultdict
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QPushButton, QGroupBox, QFormLayout,
                             QComboBox, QSpinBox, QProgressBar, QMessageBox,
-                            QFileDialog, QTextEdit, QTableWidget, QTableWidgetItem,
+                            QFileDialog, QTextEdit, QTableView, QAbstractItemView,
                             QHeaderView, QSplitter)
 from PyQt5.QtCore import Qt
 
 from job_scraper.gui.workers import LoadJobsWorker, CheckExpiredJobsWorker, DeleteExpiredJobsWorker
+from job_scraper.gui.models import JobTableModel
 
 class ManagementTab:
     """Class to handle the job management tab functionality."""
@@ -27,6 +29,8 @@ class ManagementTab:
         self.parent = parent
         self.app = app
         self.tab = QWidget()
+        self.jobs = None
+        self._job_buckets = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -151,15 +155,23 @@ class ManagementTab:
         jobs_group = QGroupBox("Jobs")
         jobs_layout = QVBoxLayout(jobs_group)
         
-        self.jobs_table = QTableWidget()
-        self.jobs_table.setColumnCount(7)
-        self.jobs_table.setHorizontalHeaderLabels(["ID", "Title", "Company", "Location", "Source", "Date Scraped", "Deadline"])
+        self.jobs_model = JobTableModel([
+            ("ID", 'id', None),
+            ("Title", 'title', None),
+            ("Company", 'company', None),
+            ("Location", 'location', None),
+            ("Source", 'source', None),
+            ("Date Scraped", 'date_scraped', None),
+            ("Deadline", 'deadline', lambda deadline: deadline or 'Not specified')
+        ], shade_expired=True, parent=self.tab)
+        self.jobs_table = QTableView()
+        self.jobs_table.setModel(self.jobs_model)
         self.jobs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # Stretch the Title column
         self.jobs_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Stretch the Company column
-        self.jobs_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.jobs_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.jobs_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-        self.jobs_table.itemSelectionChanged.connect(self.job_selected)
+        self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.jobs_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.jobs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Read-only
+        self.jobs_table.selectionModel().selectionChanged.connect(self.job_selected)
         jobs_layout.addWidget(self.jobs_table)
         
         horizontal_splitter.addWidget(jobs_group)
@@ -194,11 +206,16 @@ class ManagementTab:
             self.progress_bar.setValue(10)
             self.status_label.setText("Loading jobs...")
             
-            # Create worker thread
-            self.load_worker = LoadJobsWorker(self.app.db_manager)
+            # Pages are shown as they arrive, replacing the current jobs
+            self.jobs = None
+            self.jobs_model.set_jobs([])
+            
+            # Create worker thread; descriptions are loaded per selected job
+            self.load_worker = LoadJobsWorker(self.app, with_description=False)
             
             # Connect signals
-            self.load_worker.loaded.connect(self.jobs_loaded)
+            self.load_worker.jobs_loaded.connect(self.jobs_page_loaded)
+            self.load_worker.completed.connect(self.jobs_loaded)
             self.load_worker.error.connect(self.jobs_load_error)
             
             # Start worker
@@ -209,6 +226,15 @@ class ManagementTab:
             self.status_label.setText(f"Error: {str(e)}")
             QMessageBox.critical(self.parent, "Error", f"Error loading jobs: {str(e)}")
     
+    def jobs_page_loaded(self, jobs):
+        """Show a page of jobs while the rest are still loading.
+        
+        Args:
+            jobs (list): Page of job dictionaries
+        """
+        page_buckets = self._bucket_jobs(jobs)
+        self.jobs_model.append_jobs(page_buckets.get(self._filter_key(), []))
+    
     def jobs_loaded(self, jobs):
         """Handle successful job loading.
         
@@ -216,12 +242,15 @@ class ManagementTab:
             jobs (list): List of job dictionaries
         """
         self.jobs = jobs
+        self._job_buckets = self._bucket_jobs(jobs)
+        
+        # Rows shown page by page already match, so this keeps the view as is
         self.filter_jobs()
         
         # Update statistics
-        active_count = sum(1 for job in jobs if not job.get('expired', False))
-        expired_count = sum(1 for job in jobs if job.get('expired', False))
-        applied_count = sum(1 for job in jobs if job.get('applied', False))
+        active_count = len(self._job_buckets.get(("Active Jobs", None), ()))
+        expired_count = len(self._job_buckets.get(("Expired Jobs", None), ()))
+        applied_count = len(self._job_buckets.get(("Applied Jobs", None), ()))
         
         self.active_jobs_label.setText(f"Active Jobs: {active_count}")
         self.expired_jobs_label.setText(f"Expired Jobs: {expired_count}")
@@ -243,32 +272,43 @@ class ManagementTab:
         self.status_label.setText(f"Error: {error_msg}")
         QMessageBox.critical(self.parent, "Load Error", f"Error loading jobs: {error_msg}")
     
-    def filter_jobs(self):
-        """Filter jobs based on selected criteria."""
-        if not hasattr(self, 'jobs'):
-            return
+    def _bucket_jobs(self, jobs):
+        """Group jobs under every status and source filter they pass.
         
-        filtered_jobs = []
-        status_filter = self.status_combo.currentText()
-        source_filter = self.source_combo.currentText()
-        
-        for job in self.jobs:
-            # Apply status filter
-            if status_filter == "Active Jobs" and job.get('expired', False):
-                continue
-            elif status_filter == "Expired Jobs" and not job.get('expired', False):
-                continue
-            elif status_filter == "Applied Jobs" and not job.get('applied', False):
-                continue
+        Args:
+            jobs (list): List of job dictionaries
             
-            # Apply source filter
-            if source_filter != "All Sources":
-                if job.get('source', '').lower() != source_filter.lower():
-                    continue
+        Returns:
+            dict: Lists of jobs keyed by (status filter, lower-case source),
+                with None as the source for "All Sources"
+        """
+        buckets = defaultdict(list)
+        
+        for job in jobs:
+            statuses = ["All Jobs", "Expired Jobs" if job.get('expired', False) else "Active Jobs"]
+            if job.get('applied', False):
+                statuses.append("Applied Jobs")
+            sources = (None, (job.get('source') or '').lower())
             
-            filtered_jobs.append(job)
+            for status in statuses:
+                for source in sources:
+                    buckets[status, source].append(job)
         
-        self.display_management_jobs(filtered_jobs)
+        return buckets
+    
+    def _filter_key(self):
+        """Get the bucket key for the selected status and source filters."""
+        source_filter = self.source_combo.currentText()
+        source = None if source_filter == "All Sources" else source_filter.lower()
+        return self.status_combo.currentText(), source
+    
+    def filter_jobs(self):
+        """Filter jobs based on selected criteria."""
+        if self.jobs is None:
+            return
+        
+        # Jobs were grouped by filter when loaded, so filtering is a lookup
+        self.display_management_jobs(self._job_buckets.get(self._filter_key(), []))
     
     def display_management_jobs(self, jobs):
         """Display filtered jobs in the management table.
@@ -276,93 +316,56 @@ class ManagementTab:
         Args:
             jobs: List of job dictionaries to display
         """
-        self.jobs_table.setRowCount(0)  # Clear table
-        
-        for job in jobs:
-            row = self.jobs_table.rowCount()
-            self.jobs_table.insertRow(row)
-            
-            # ID
-            id_item = QTableWidgetItem(str(job.get('id', '')))
-            self.jobs_table.setItem(row, 0, id_item)
-            
-            # Title
-            title_item = QTableWidgetItem(job.get('title', ''))
-            self.jobs_table.setItem(row, 1, title_item)
-            
-            # Company
-            company_item = QTableWidgetItem(job.get('company', ''))
-            self.jobs_table.setItem(row, 2, company_item)
-            
-            # Location
-            location_item = QTableWidgetItem(job.get('location', ''))
-            self.jobs_table.setItem(row, 3, location_item)
-            
-            # Source
-            source_item = QTableWidgetItem(job.get('source', ''))
-            self.jobs_table.setItem(row, 4, source_item)
-            
-            # Date Scraped
-            date_scraped = job.get('date_scraped', '')
-            date_item = QTableWidgetItem(date_scraped)
-            self.jobs_table.setItem(row, 5, date_item)
-            
-            # Deadline
-            deadline_item = QTableWidgetItem(job.get('deadline', 'Not specified'))
-            self.jobs_table.setItem(row, 6, deadline_item)
-            
-            # Color code expired jobs
-            if job.get('expired', False):
-                for col in range(self.jobs_table.columnCount()):
-                    item = self.jobs_table.item(row, col)
-                    item.setBackground(Qt.lightGray)
-            
-            # Store the job data in first column item
-            id_item.setData(Qt.UserRole, job)
+        # The model renders cells on demand, so this is a single reset
+        self.jobs_model.set_jobs(jobs)
         
         self.status_label.setText(f"Displayed {len(jobs)} jobs")
         self.parent.logger.info(f"Displayed {len(jobs)} jobs in management tab")
     
     def job_selected(self):
         """Handle job selection event."""
-        selected_items = self.jobs_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.jobs_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.job_details.clear()
             return
         
-        # Get the job data from the first cell of the selected row
-        row = selected_items[0].row()
-        job_item = self.jobs_table.item(row, 0)
-        selected_job = job_item.data(Qt.UserRole)
+        # Get the job data for the selected row
+        selected_job = self.jobs_model.job_at(selected_rows[0].row())
+        
+        # Load the description on first selection and keep it with the job
+        if 'description' not in selected_job:
+            full_job = self.app.db_manager.get_job(selected_job.get('id'))
+            selected_job['description'] = full_job.get('description') if full_job else None
         
-        # Display job details
-        details = ""
-        details += f"<h2>{selected_job.get('title', '')}</h2>"
-        details += f"<p><b>Company:</b> {selected_job.get('company', '')}</p>"
-        details += f"<p><b>Location:</b> {selected_job.get('location', '')}</p>"
-        details += f"<p><b>Source:</b> {selected_job.get('source', '')}</p>"
-        details += f"<p><b>Date Scraped:</b> {selected_job.get('date_scraped', '')}</p>"
-        details += f"<p><b>Deadline:</b> {selected_job.get('deadline', 'Not specified')}</p>"
+        # Display job details, collected in parts and joined once
+        details = [
+            f"<h2>{selected_job.get('title', '')}</h2>",
+            f"<p><b>Company:</b> {selected_job.get('company', '')}</p>",
+            f"<p><b>Location:</b> {selected_job.get('location', '')}</p>",
+            f"<p><b>Source:</b> {selected_job.get('source', '')}</p>",
+            f"<p><b>Date Scraped:</b> {selected_job.get('date_scraped', '')}</p>",
+            f"<p><b>Deadline:</b> {selected_job.get('deadline', 'Not specified')}</p>"
+        ]
         
         if selected_job.get('expired', False):
-            details += f"<p><b>Status:</b> <span style='color:red'>Expired</span></p>"
+            details.append("<p><b>Status:</b> <span style='color:red'>Expired</span></p>")
         elif selected_job.get('applied', False):
-            details += f"<p><b>Status:</b> <span style='color:blue'>Applied</span></p>"
-            details += f"<p><b>Application Date:</b> {selected_job.get('application_date', '')}</p>"
+            details.append("<p><b>Status:</b> <span style='color:blue'>Applied</span></p>")
+            details.append(f"<p><b>Application Date:</b> {selected_job.get('application_date', '')}</p>")
         else:
-            details += f"<p><b>Status:</b> <span style='color:green'>Active</span></p>"
+            details.append("<p><b>Status:</b> <span style='color:green'>Active</span></p>")
         
         if selected_job.get('match_score', 0) > 0:
-            details += f"<p><b>Match Score:</b> {selected_job.get('match_score')}%</p>"
+            details.append(f"<p><b>Match Score:</b> {selected_job.get('match_score')}%</p>")
         
         if 'url' in selected_job and selected_job['url']:
-            details += f"<p><b>URL:</b> <a href='{selected_job['url']}'>{selected_job['url']}</a></p>"
+            details.append(f"<p><b>URL:</b> <a href='{selected_job['url']}'>{selected_job['url']}</a></p>")
         
         if 'description' in selected_job and selected_job['description']:
-            details += "<h3>Description</h3>"
-            details += f"<div style='white-space: pre-wrap;'>{selected_job['description']}</div>"
+            details.append("<h3>Description</h3>")
+            details.append(f"<div style='white-space: pre-wrap;'>{selected_job['description']}</div>")
         
-        self.job_details.setHtml(details)
+        self.job_details.setHtml("".join(details))
         
         self.parent.logger.info(f"Selected job: {selected_job.get('title')} at {selected_job.get('company')}")
     
@@ -2,14 +2,15 @@
 
 import os
 import logging
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, QModelIndex, pyqtSlot
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QSpinBox, QProgressBar,
-    QGroupBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QGroupBox, QTableView, QHeaderView,
     QAbstractItemView, QMessageBox, QComboBox
 )
 
+from job_scraper.gui.models import JobTableModel
 from job_scraper.gui.workers import MatchJobsWorker
 from job_scraper.gui.dialogs import JobDetailsDialog, CoverLetterDialog
 from job_scraper.config.constants import Constants
@@ -55,6 +56,7 @@ class MatchesTab(QWidget):
         self.top_n_spinbox = QSpinBox()
         self.top_n_spinbox.setRange(5, 50)
         self.top_n_spinbox.setValue(10)
+        self.top_n_spinbox.valueChanged.connect(self._show_top_matches)
         controls_layout.addWidget(self.top_n_spinbox)
         
         self.match_button = QPushButton("Match Jobs")
@@ -71,11 +73,16 @@ class MatchesTab(QWidget):
         main_layout.addWidget(self.progress_bar)
         
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels([
-            "Match Score", "Title", "Company", "Location", "Posted", "Source"
-        ])
+        self.results_model = JobTableModel([
+            ("Match Score", 'match_score', lambda score: f"{score or 0:.1f}%"),
+            ("Title", 'title', None),
+            ("Company", 'company', None),
+            ("Location", 'location', None),
+            ("Posted", 'date_posted', None),
+            ("Source", 'source', None)
+        ], parent=self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.results_table.setSortingEnabled(True)
@@ -83,7 +90,7 @@ class MatchesTab(QWidget):
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         
         # Double-click to view job details
-        self.results_table.itemDoubleClicked.connect(self.view_job_details)
+        self.results_table.doubleClicked.connect(self.view_job_details)
         
         main_layout.addWidget(self.results_table, 1)
         
@@ -130,7 +137,7 @@ class MatchesTab(QWidget):
             return
             
         # Clear previous results
-        self.results_table.setRowCount(0)
+        self.results_model.set_jobs([])
         self.matched_jobs = []
         
         # Update UI
@@ -142,10 +149,11 @@ class MatchesTab(QWidget):
         
         # Start worker thread
         try:
+            # Rank as many jobs as the spinbox allows so changing it needs no re-match
             self.worker = MatchJobsWorker(
                 self.app,
                 self.resume_data,
-                self.top_n_spinbox.value()
+                self.top_n_spinbox.maximum()
             )
             
             self.worker.progress.connect(self.update_progress)
@@ -180,28 +188,13 @@ class MatchesTab(QWidget):
         self.progress_bar.setVisible(False)
         self.match_button.setEnabled(True)
         
-        # Populate table
-        self.results_table.setRowCount(len(matched_jobs))
-        
-        for i, job in enumerate(matched_jobs):
-            # Match score
-            match_score = job.get('match_score', 0)
-            score_item = QTableWidgetItem(f"{match_score:.1f}%")
-            score_item.setData(Qt.UserRole, job.get('id'))
-            self.results_table.setItem(i, 0, score_item)
-            
-            # Other columns
-            self.results_table.setItem(i, 1, QTableWidgetItem(job.get('title', '')))
-            self.results_table.setItem(i, 2, QTableWidgetItem(job.get('company', '')))
-            self.results_table.setItem(i, 3, QTableWidgetItem(job.get('location', '')))
-            self.results_table.setItem(i, 4, QTableWidgetItem(job.get('date_posted', '')))
-            self.results_table.setItem(i, 5, QTableWidgetItem(job.get('source', '')))
-            
         # Sort by match score
-        self.results_table.sortItems(0, Qt.DescendingOrder)
+        self.results_table.horizontalHeader().setSortIndicator(0, Qt.DescendingOrder)
+        
+        # Populate table
+        count = self._show_top_matches(self.top_n_spinbox.value())
         
         # Update status
-        count = len(matched_jobs)
         if count > 0:
             self.status_label.setText(f"Found {count} matching jobs")
             self.view_button.setEnabled(True)
@@ -213,6 +206,24 @@ class MatchesTab(QWidget):
             
         self.worker = None
         
+    def _show_top_matches(self, top_n):
+        """Display the best of the matched jobs in the results table.
+        
+        Args:
+            top_n: Number of top matches to display
+            
+        Returns:
+            Number of jobs displayed
+        """
+        top_matches = self.matched_jobs[:top_n]
+        self.results_model.set_jobs(top_matches)
+        
+        # Keep the order the user sorted the table by
+        header = self.results_table.horizontalHeader()
+        self.results_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        
+        return len(top_matches)
+        
     @pyqtSlot(str)
     def show_error(self, error_message):
         """Display an error message.
@@ -235,21 +246,12 @@ class MatchesTab(QWidget):
         Returns:
             Selected job dictionary or None if no job is selected
         """
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select a job first.")
             return None
             
-        # Get the job ID from the first column's UserRole data
-        row = selected_items[0].row()
-        job_id = self.results_table.item(row, 0).data(Qt.UserRole)
-        
-        # Find the job in the matched jobs list
-        for job in self.matched_jobs:
-            if job.get('id') == job_id:
-                return job
-                
-        return None
+        return self.results_model.job_at(selected_rows[0].row())
         
     def view_selected_job(self):
         """View details of the selected job."""
@@ -261,10 +263,10 @@ class MatchesTab(QWidget):
         """View job details in a dialog.
         
         Args:
-            job_or_item: Job dictionary or QTableWidgetItem
+            job_or_item: Job dictionary or QModelIndex of a table cell
         """
-        if isinstance(job_or_item, QTableWidgetItem):
-            job = self.get_selected_job()
+        if isinstance(job_or_item, QModelIndex):
+            job = self.results_model.job_at(job_or_item.row())
             if not job:
                 return
         else:
@@ -0,0 +1,191 @@
+"""Table models for the job scraper GUI."""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+# Rows added to the view each time it scrolls past the loaded ones
+FETCH_BATCH_SIZE = 100
+
+# Match score background colours, highest threshold first, built once
+_MATCH_COLORS = ((80, QColor(Qt.green)), (60, QColor(Qt.yellow)))
+_LOW_MATCH_COLOR = QColor(Qt.lightGray)
+_EXPIRED_COLOR = QColor(Qt.lightGray)
+
+
+def _match_color(match_score):
+    """Get the background colour for a match score, or None for no match."""
+    for threshold, color in _MATCH_COLORS:
+        if match_score >= threshold:
+            return color
+    return _LOW_MATCH_COLOR if match_score > 0 else None
+
+
+def _sort_key(value):
+    """Order numbers before text without comparing mixed types."""
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    return (1, 0, str(value).lower())
+
+
+class JobTableModel(QAbstractTableModel):
+    """Read-only model presenting a list of job dictionaries as table rows.
+
+    Cell text is produced only when the view paints a cell, so replacing
+    the job list costs a single model reset instead of one item per cell.
+    Rows are exposed to the view in batches as it scrolls, so large job
+    lists open without laying out every row. The job dictionary for a row
+    is available under ``Qt.UserRole``.
+    """
+
+    def __init__(self, columns, score_column=None, shade_expired=False, parent=None):
+        """Initialize the model.
+
+        Args:
+            columns: List of (header, key, formatter) tuples. The formatter
+                turns the job's value for key into display text and may be
+                None to use str().
+            score_column: Index of a match score column to colour code, if any
+            shade_expired: Whether to grey out the rows of expired jobs
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._columns = columns
+        self._score_column = score_column
+        self._shade_expired = shade_expired
+        self._jobs = []
+        self._shown = []
+        self._loaded = 0
+
+    def set_jobs(self, jobs):
+        """Replace the displayed jobs.
+
+        When every row would show the same values as before, the new job
+        dictionaries are swapped in without resetting the view, so the
+        selection and scroll position are kept.
+
+        Args:
+            jobs: List of job dictionaries
+        """
+        jobs = list(jobs)
+        shown = [self._shown_values(job) for job in jobs]
+
+        if shown == self._shown:
+            self._jobs = jobs
+            return
+
+        self.beginResetModel()
+        self._jobs = jobs
+        self._shown = shown
+        self._loaded = min(FETCH_BATCH_SIZE, len(self._jobs))
+        self.endResetModel()
+
+    def append_jobs(self, jobs):
+        """Add jobs after the current ones without resetting the view.
+
+        Args:
+            jobs: List of job dictionaries
+        """
+        self._jobs.extend(jobs)
+        self._shown.extend(self._shown_values(job) for job in jobs)
+
+        # Fill the first batch right away; later rows load as the view scrolls
+        count = min(FETCH_BATCH_SIZE, len(self._jobs)) - self._loaded
+        if count > 0:
+            self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+            self._loaded += count
+            self.endInsertRows()
+
+    def _shown_values(self, job):
+        """Get the values of a job that the table displays."""
+        return tuple(job.get(key) for _, key, _ in self._columns)
+
+    def job_at(self, row):
+        """Get the job dictionary shown in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Job dictionary or None if the row is out of range
+        """
+        if 0 <= row < self._loaded:
+            return self._jobs[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._jobs)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+
+        count = min(FETCH_BATCH_SIZE, len(self._jobs) - self._loaded)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        job = self._jobs[index.row()]
+
+        if role == Qt.DisplayRole:
+            _, key, formatter = self._columns[index.column()]
+            value = job.get(key)
+            if formatter:
+                return formatter(value)
+            if isinstance(value, (int, float)):
+                # Qt formats numbers itself
+                return value
+            return "" if value is None else str(value)
+
+        if role == Qt.UserRole:
+            return job
+
+        if role == Qt.BackgroundRole:
+            if index.column() == self._score_column:
+                # Color code based on match score
+                return _match_color(job.get('match_score') or 0)
+            if self._shade_expired and job.get('expired', False):
+                return _EXPIRED_COLOR
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by the raw values of a column, keeping selections on the same jobs."""
+        key = self._columns[column][1]
+
+        self.layoutAboutToBeChanged.emit()
+
+        old_indexes = self.persistentIndexList()
+        old_jobs = [self._jobs[index.row()] for index in old_indexes]
+
+        # Jobs missing the value stay at the bottom in either direction
+        present = [job for job in self._jobs if job.get(key) is not None]
+        missing = [job for job in self._jobs if job.get(key) is None]
+        present.sort(key=lambda job: _sort_key(job[key]), reverse=(order == Qt.DescendingOrder))
+        self._jobs = present + missing
+        self._shown = [self._shown_values(job) for job in self._jobs]
+
+        new_rows = {id(job): row for row, job in enumerate(self._jobs)}
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[id(job)], index.column()) for index, job in zip(old_indexes, old_jobs)]
+        )
+
+        self.layoutChanged.emit()
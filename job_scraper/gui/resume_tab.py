@@ -13,6 +13,7 @@ from PyQt5.QtCore import Qt, pyqtSlot
 
 from job_scraper.gui.workers import ParseResumeWorker
 from job_scraper.gui.dialogs import ResumeViewDialog
+from job_scraper.gui.ui_helpers import batch_table_update
 
 class ResumeTab(QWidget):
     """Resume tab for resume parsing and handling functionality."""
@@ -202,10 +203,11 @@ class ResumeTab(QWidget):
         
         # Update skills table
         skills = resume_data.get('skills', [])
-        self.skills_table.setRowCount(len(skills))
-        
-        for i, skill in enumerate(skills):
-            self.skills_table.setItem(i, 0, QTableWidgetItem(skill))
+        with batch_table_update(self.skills_table):
+            self.skills_table.setRowCount(len(skills))
+            
+            for i, skill in enumerate(skills):
+                self.skills_table.setItem(i, 0, QTableWidgetItem(skill))
             
         # Enable buttons
         self.parse_button.setEnabled(True)
@@ -19,6 +19,7 @@ from PyQt5.QtWidgets import (
 )
 
 from job_scraper.gui.workers import ScrapeJobsWorker
+from job_scraper.gui.ui_helpers import batch_table_update
 
 
 class SearchTab(QWidget):
@@ -180,7 +181,7 @@ class SearchTab(QWidget):
             )
             
             self.worker.progress.connect(self.update_progress)
-            self.worker.job_found.connect(self.add_job_result)
+            self.worker.jobs_found.connect(self.add_job_results)
             self.worker.completed.connect(self.search_completed)
             self.worker.error.connect(self.show_error)
             
@@ -213,7 +214,18 @@ class SearchTab(QWidget):
         self.progress_label.setText(message)
         self.progress_bar.setValue(int(current / total * 100))
         
-    @pyqtSlot(dict)
+    @pyqtSlot(list)
+    def add_job_results(self, jobs):
+        """Add a batch of jobs to the results table.
+        
+        Args:
+            jobs: List of job data dictionaries
+        """
+        # Sort and repaint once for the whole batch rather than once per row
+        with batch_table_update(self.results_table):
+            for job in jobs:
+                self.add_job_result(job)
+            
     def add_job_result(self, job):
         """Add a job to the results table.
         
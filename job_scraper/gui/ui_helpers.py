@@ -4,10 +4,17 @@ UI helper functions for job scraper GUI.
 These functions help reduce code duplication in UI creation.
 """
 
+from contextlib import contextmanager
+
 from PyQt5.QtWidgets import (QLabel, QLineEdit, QPushButton, QFileDialog, 
                             QSpinBox, QCheckBox, QHBoxLayout, QTableWidget,
                             QTableWidgetItem, QHeaderView, QMessageBox)
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush
+
+# Item brushes, built once and shared by every item
+_EXPIRED_BRUSH = QBrush(Qt.red)
+_MATCH_BRUSHES = ((80, QBrush(Qt.green)), (60, QBrush(Qt.yellow)), (40, QBrush(Qt.lightGray)))
 
 
 def create_file_selector(label_text, placeholder_text, file_types, parent=None):
@@ -75,6 +82,39 @@ def setup_table(column_names, stretch_column=0, selection_behavior=QTableWidget.
     return table
 
 
+@contextmanager
+def batch_table_update(table):
+    """Pause repainting, sorting and column sizing while a table is being filled.
+    
+    The rows are sorted, measured and painted once when the block exits.
+    Sorting also stays off while items are set, so rows cannot move
+    between setItem calls.
+    
+    Args:
+        table: QTableWidget being populated
+        
+    Yields:
+        The table
+    """
+    header = table.horizontalHeader()
+    # Columns sized to their contents would be re-measured after every item
+    content_sized = [section for section in range(header.count())
+                     if header.sectionResizeMode(section) == QHeaderView.ResizeToContents]
+    for section in content_sized:
+        header.setSectionResizeMode(section, QHeaderView.Fixed)
+        
+    sorting_enabled = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting_enabled)
+        for section in content_sized:
+            header.setSectionResizeMode(section, QHeaderView.ResizeToContents)
+
+
 def create_job_item(value, is_expired=False, color_by_match=None):
     """Create a table item for job data with appropriate styling.
     
@@ -86,19 +126,22 @@ def create_job_item(value, is_expired=False, color_by_match=None):
     Returns:
         Configured QTableWidgetItem
     """
-    item = QTableWidgetItem(str(value))
+    if isinstance(value, (int, float)):
+        # Stored as a number, so Qt formats it and the column sorts numerically
+        item = QTableWidgetItem()
+        item.setData(Qt.DisplayRole, value)
+    else:
+        item = QTableWidgetItem(str(value))
     
     if is_expired:
-        item.setForeground(Qt.red)
+        item.setForeground(_EXPIRED_BRUSH)
     
     if color_by_match is not None:
         match_score = float(color_by_match)
-        if match_score >= 80:
-            item.setBackground(Qt.green)
-        elif match_score >= 60:
-            item.setBackground(Qt.yellow)
-        elif match_score >= 40:
-            item.setBackground(Qt.lightGray)
+        for threshold, brush in _MATCH_BRUSHES:
+            if match_score >= threshold:
+                item.setBackground(brush)
+                break
     
     return item
 
@@ -175,20 +218,21 @@ def format_job_details(job):
     Returns:
         Formatted text for display
     """
-    details_text = f"Job Details\n{'='*50}\n\n"
-    details_text += f"Title: {job.get('title', 'Unknown')}\n"
-    details_text += f"Company: {job.get('company', 'Unknown')}\n"
-    details_text += f"Location: {job.get('location', 'Unknown')}\n"
-    details_text += f"Source: {job.get('source', 'Unknown')}\n"
-    details_text += f"Date Scraped: {job.get('date_scraped', 'Unknown')}\n"
-    details_text += f"Deadline: {job.get('deadline', 'Unknown')}\n"
-    details_text += f"Status: {'Expired' if job.get('is_expired', 0) == 1 else 'Active'}\n"
-    details_text += f"URL: {job.get('link', 'Unknown')}\n\n"
-    
-    details_text += f"Job Description\n{'-'*50}\n\n"
-    details_text += job.get('description', 'No description available')
-    
-    return details_text
+    details_text = (
+        f"Job Details\n{'='*50}\n\n"
+        f"Title: {job.get('title', 'Unknown')}\n"
+        f"Company: {job.get('company', 'Unknown')}\n"
+        f"Location: {job.get('location', 'Unknown')}\n"
+        f"Source: {job.get('source', 'Unknown')}\n"
+        f"Date Scraped: {job.get('date_scraped', 'Unknown')}\n"
+        f"Deadline: {job.get('deadline', 'Unknown')}\n"
+        f"Status: {'Expired' if job.get('is_expired', 0) == 1 else 'Active'}\n"
+        f"URL: {job.get('link', 'Unknown')}\n\n"
+        f"Job Description\n{'-'*50}\n\n"
+    )
+    
+    # Append the description once rather than copying it through repeated +=
+    return details_text + job.get('description', 'No description available')
 
 
 def format_resume_results(resume_data):
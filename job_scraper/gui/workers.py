@@ -9,13 +9,80 @@ import time
 import logging
 import threading
 import webbrowser
+from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
+# Maximum number of pooled workers running at the same time
+WORKER_POOL_SIZE = 4
 
-class ApplyToJobWorker(QThread):
+
+class _WorkerRunnable(QRunnable):
+    """Runs a PooledWorker's run() on a thread pool thread."""
+    
+    def __init__(self, worker):
+        """Initialize the runnable.
+        
+        Args:
+            worker: PooledWorker to run
+        """
+        super().__init__()
+        self.worker = worker
+        
+    def run(self):
+        """Run the worker and signal when it is done."""
+        try:
+            self.worker.run()
+        finally:
+            self.worker._running = False
+            self.worker.finished.emit()
+            
+
+class _PooledWorkerMeta(type(QObject), ABCMeta):
+    """Metaclass letting QObject subclasses declare abstract methods."""
+    
+
+class PooledWorker(QObject, metaclass=_PooledWorkerMeta):
+    """Base class for short background tasks run on the shared thread pool.
+    
+    Subclasses declare their signals and implement run() as they would for
+    a QThread. start() queues the task on QThreadPool.globalInstance(), so
+    threads are reused between tasks instead of created for every click.
+    """
+    
+    finished = pyqtSignal()
+    
+    def __init__(self):
+        """Initialize the worker."""
+        super().__init__()
+        self._running = False
+        
+    def start(self):
+        """Queue the worker on the shared thread pool."""
+        pool = QThreadPool.globalInstance()
+        if pool.maxThreadCount() != WORKER_POOL_SIZE:
+            pool.setMaxThreadCount(WORKER_POOL_SIZE)
+            
+        self._running = True
+        pool.start(_WorkerRunnable(self))
+        
+    def isRunning(self):
+        """Check whether the worker is queued or running.
+        
+        Returns:
+            bool: True until run() has returned
+        """
+        return self._running
+        
+    @abstractmethod
+    def run(self):
+        """Do the worker's task; implemented by subclasses."""
+        pass
+
+
+class ApplyToJobWorker(PooledWorker):
     """Worker thread for applying to jobs."""
     
     progress = pyqtSignal(str)
@@ -73,7 +140,7 @@ class ApplyToJobWorker(QThread):
             self.completed.emit(False)
             
 
-class GenerateAICoverLetterWorker(QThread):
+class GenerateAICoverLetterWorker(PooledWorker):
     """Worker thread for generating AI cover letters."""
     
     progress = pyqtSignal(str)
@@ -119,7 +186,7 @@ class GenerateAICoverLetterWorker(QThread):
             self.error.emit(error_msg)
             
 
-class ParseResumeWorker(QThread):
+class ParseResumeWorker(PooledWorker):
     """Worker thread for parsing resumes."""
     
     progress = pyqtSignal(str)
@@ -155,7 +222,7 @@ class ParseResumeWorker(QThread):
             self.error.emit(error_msg)
             
 
-class MatchJobsWorker(QThread):
+class MatchJobsWorker(PooledWorker):
     """Worker thread for matching jobs with resume."""
     
     progress = pyqtSignal(str)
@@ -211,7 +278,7 @@ class ScrapeJobsWorker(QThread):
     """Worker thread for scraping jobs."""
     
     progress = pyqtSignal(str, int, int)
-    job_found = pyqtSignal(dict)
+    jobs_found = pyqtSignal(list)
     completed = pyqtSignal(list)
     error = pyqtSignal(str)
     
@@ -253,12 +320,16 @@ class ScrapeJobsWorker(QThread):
                 self.location
             )
             
-            # Add jobs to database and emit signals
-            for job in jobs:
-                job_id = self.app.db_manager.add_job(job)
-                if job_id:
-                    job['id'] = job_id
-                    self.job_found.emit(job)
+            # Add jobs to database in one transaction
+            job_ids = self.app.db_manager.insert_jobs_bulk(jobs)
+            if len(job_ids) != len(jobs):
+                raise RuntimeError(f"Saved {len(job_ids)} of {len(jobs)} scraped jobs to the database")
+            for job, job_id in zip(jobs, job_ids):
+                job['id'] = job_id
+                
+            # Hand the results to the GUI in a single signal
+            if jobs:
+                self.jobs_found.emit(jobs)
                     
             self.progress.emit(f"Found {len(jobs)} jobs", 100, 100)
             self.completed.emit(jobs)
@@ -269,26 +340,30 @@ class ScrapeJobsWorker(QThread):
             self.error.emit(error_msg)
             
 
-class LoadJobsWorker(QThread):
+class LoadJobsWorker(PooledWorker):
     """Worker thread for loading jobs from database."""
     
     progress = pyqtSignal(str)
-    job_loaded = pyqtSignal(dict)
+    jobs_loaded = pyqtSignal(list)
     completed = pyqtSignal(list)
     error = pyqtSignal(str)
     
-    def __init__(self, app, filter_status=None, min_match_score=0):
+    def __init__(self, app, filter_status=None, min_match_score=0, with_description=True, page_size=500):
         """Initialize the worker.
         
         Args:
             app: Application instance
             filter_status: Filter jobs by status (None for all jobs)
             min_match_score: Minimum match score for filtering
+            with_description: Whether to load job descriptions
+            page_size: Number of jobs emitted per jobs_loaded signal
         """
         super().__init__()
         self.app = app
         self.filter_status = filter_status
         self.min_match_score = min_match_score
+        self.with_description = with_description
+        self.page_size = page_size
         self.logger = logging.getLogger(__name__)
         
     def run(self):
@@ -296,18 +371,19 @@ class LoadJobsWorker(QThread):
         try:
             self.progress.emit("Loading jobs from database...")
             
-            # Get jobs from database
-            jobs = self.app.db_manager.get_jobs(
+            # Hand each page to the GUI as soon as it is read
+            jobs = []
+            for page in self.app.db_manager.iter_jobs(
                 status=self.filter_status,
-                min_match_score=self.min_match_score
-            )
+                min_match=self.min_match_score,
+                page_size=self.page_size,
+                with_description=self.with_description
+            ):
+                jobs.extend(page)
+                self.jobs_loaded.emit(page)
+                self.progress.emit(f"Loaded {len(jobs)} jobs...")
             
             self.progress.emit(f"Loaded {len(jobs)} jobs")
-            
-            # Emit signals for each job
-            for job in jobs:
-                self.job_loaded.emit(job)
-                
             self.completed.emit(jobs)
             
         except Exception as e:
@@ -316,7 +392,7 @@ class LoadJobsWorker(QThread):
             self.error.emit(error_msg)
             
 
-class CheckExpiredJobsWorker(QThread):
+class CheckExpiredJobsWorker(PooledWorker):
     """Worker thread for checking expired jobs."""
     
     progress = pyqtSignal(str)
@@ -350,7 +426,7 @@ class CheckExpiredJobsWorker(QThread):
             self.error.emit(error_msg)
             
 
-class DeleteExpiredJobsWorker(QThread):
+class DeleteExpiredJobsWorker(PooledWorker):
     """Worker thread for deleting expired jobs."""
     
     progress = pyqtSignal(str)
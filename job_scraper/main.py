@@ -66,10 +66,19 @@ def run_headless(app, args):
         logger.info(f"Deleted {count} expired jobs")
 
 
-def main():
-    """Main entry point."""
+def main(headless=None):
+    """Main entry point.
+    
+    Args:
+        headless: Force headless mode on or off, or None to follow --headless
+        
+    Returns:
+        Exit code
+    """
     # Parse command line arguments
     args = parse_args()
+    if headless is not None:
+        args.headless = headless
     
     # Initialize application
     app = Job4UApp()
@@ -84,6 +93,8 @@ def main():
     except Exception as e:
         app.logger.error(f"Error running application: {str(e)}", exc_info=True)
         return 1
+    finally:
+        app.close()
         
     return 0
 
@@ -3,26 +3,37 @@ Base scraper class definition for job scraping.
 """
 
 import time
+import queue
 import random
 import logging
 import re
 import datetime
+import importlib.util
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Union
 import requests
 from bs4 import BeautifulSoup
 
-from job_scraper.utils.utils import Utils
 from job_scraper.config.constants import Constants
-from job_scraper.utils.utils import validate_url
+from job_scraper.utils.utils import Utils, validate_url
 
 logger = logging.getLogger(__name__)
 
+# Flag to track if lxml is available; BeautifulSoup imports it itself
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+if not LXML_AVAILABLE:
+    logger.debug("lxml is not available. HTML will be parsed with html.parser. Install with: pip install lxml")
+
+# BeautifulSoup parser used for all scraped pages
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
 class BaseScraper(ABC):
     """
     Base abstract class for all job scrapers.
@@ -48,6 +59,10 @@ class BaseScraper(ABC):
         self.setup_webdriver()
         self.job_listings = []
         
+        # Idle WebDriver instances that can be handed out again instead of
+        # starting a new browser for every URL
+        self._driver_pool = queue.Queue()
+        
     def setup_webdriver(self):
         """Set up Chrome options for Selenium."""
         self.chrome_options = Options()
@@ -76,6 +91,58 @@ class BaseScraper(ABC):
             service = Service(ChromeDriverManager().install())
             return webdriver.Chrome(service=service, options=self.chrome_options)
     
+    def _acquire_driver(self):
+        """Take an idle WebDriver from the pool, starting a new one if none is free."""
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            return self.get_driver()
+            
+    def _release_driver(self, driver):
+        """
+        Reset a WebDriver and return it to the pool for reuse.
+        
+        Drivers that cannot be reset are quit instead of being pooled.
+        
+        Args:
+            driver: WebDriver instance obtained from _acquire_driver
+        """
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception as e:
+            self.logger.debug(f"Discarding WebDriver that could not be reset: {str(e)}")
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        self._driver_pool.put(driver)
+        
+    def close(self):
+        """Quit every pooled WebDriver."""
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.debug(f"Error quitting WebDriver: {str(e)}")
+    
+    @contextmanager
+    def _driver_ctx(self):
+        """Yield a new WebDriver instance and quit it exactly once on exit."""
+        driver = self.get_driver()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.debug(f"Error quitting WebDriver: {str(e)}")
+    
     def check_site_allowed(self, domain):
         """
         Check if scraping is allowed for this site according to robots.txt.
@@ -91,9 +158,11 @@ class BaseScraper(ABC):
         if isinstance(respect_robots_txt, str):
             respect_robots_txt = respect_robots_txt.lower() == 'true'
             
-        if respect_robots_txt:
-            return Utils.check_robots_txt(domain)
-        return True
+        if not respect_robots_txt:
+            return True
+            
+        # robots.txt is cached per domain with an expiry, shared by all scrapers
+        return Utils.check_robots_txt(domain, getattr(self, 'user_agent', '*'))
     
     def add_random_delay(self):
         """Add a random delay between requests to avoid getting blocked."""
@@ -220,16 +289,15 @@ class BaseScraper(ABC):
         self.logger.error(f"Failed to fetch {url} after {self.retry_count} attempts")
         return None
         
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content with BeautifulSoup."""
-        return BeautifulSoup(html_content, 'html.parser')
+    def parse_html(self, html_content: Union[str, bytes]) -> BeautifulSoup:
+        """Parse HTML content with BeautifulSoup, using lxml when available."""
+        return BeautifulSoup(html_content, HTML_PARSER)
     
-    @abstractmethod
     def scrape(self, search_terms, location, num_pages=None):
         """
         Scrape job listings.
         
-        This is an abstract method that must be implemented by subclasses.
+        Collects everything yielded by ``iter_jobs`` into ``self.job_listings``.
         
         Args:
             search_terms (list): List of job titles or keywords to search
@@ -239,6 +307,24 @@ class BaseScraper(ABC):
         Returns:
             list: Job listings
         """
+        self.job_listings.extend(self.iter_jobs(search_terms, location, num_pages))
+        return self.job_listings
+    
+    @abstractmethod
+    def iter_jobs(self, search_terms, location, num_pages=None) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape job listings, yielding each job as soon as it is parsed.
+        
+        This is an abstract method that must be implemented by subclasses.
+        
+        Args:
+            search_terms (list): List of job titles or keywords to search
+            location (str): Location to search for jobs
+            num_pages (int): Number of pages to scrape
+            
+        Yields:
+            dict: Job listing
+        """
         pass
     
     @abstractmethod
@@ -280,9 +366,22 @@ class BaseScraper(ABC):
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_search_jobs(keywords, location))
+    
+    def iter_search_jobs(self, keywords: str, location: str) -> Iterator[Dict[str, Any]]:
+        """
+        Search for jobs with given keywords and location, yielding each job as it arrives.
+        
+        Args:
+            keywords: Keywords to search for (space-separated string)
+            location: Location to search in
+            
+        Yields:
+            Job dictionary
+        """
         self.logger.info(f"Searching for jobs with keywords: {keywords}, location: {location}")
         keyword_list = keywords.split()
-        return self.search_jobs_concurrent(keyword_list, location, num_pages=1)
+        yield from self.iter_search_jobs_concurrent(keyword_list, location, num_pages=1)
     
     def search_jobs_concurrent(self, keywords: List[str], location: str, num_pages: int = 1) -> List[Dict[str, Any]]:
         """
@@ -296,28 +395,29 @@ class BaseScraper(ABC):
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_search_jobs_concurrent(keywords, location, num_pages))
+    
+    def iter_search_jobs_concurrent(self, keywords: List[str], location: str, num_pages: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Search for jobs concurrently across multiple pages, yielding each job
+        as soon as its details have been fetched.
+        
+        Args:
+            keywords: List of search terms
+            location: Job location
+            num_pages: Number of pages to search
+            
+        Yields:
+            Job dictionary
+        """
         search_urls = self.get_search_urls(keywords, location, num_pages)
         
         if not search_urls:
             self.logger.warning("No search URLs generated")
-            return []
+            return
             
         # Get job listings concurrently
-        job_urls = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_url = {
-                executor.submit(self.extract_job_urls, url): url 
-                for url in search_urls
-            }
-            
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    urls = future.result()
-                    if urls:
-                        job_urls.extend(urls)
-                except Exception as e:
-                    self.logger.error(f"Error processing search page {url}: {str(e)}")
+        job_urls = self.extract_job_urls_batch(search_urls)
                     
         self.logger.info(f"Found {len(job_urls)} job URLs")
         
@@ -332,7 +432,6 @@ class BaseScraper(ABC):
         self.logger.info(f"Found {len(unique_job_urls)} unique job URLs")
         
         # Get job details concurrently
-        all_jobs = []
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Limit the number of jobs to process based on config
             max_jobs = self.config.get('max_jobs', 100)
@@ -350,11 +449,37 @@ class BaseScraper(ABC):
                 try:
                     job_details = future.result()
                     if job_details:
-                        all_jobs.append(job_details)
+                        yield job_details
                 except Exception as e:
                     self.logger.error(f"Error getting details for job {url}: {str(e)}")
+    
+    def extract_job_urls_batch(self, search_urls: List[str]) -> List[str]:
+        """
+        Extract job URLs from several search results pages concurrently.
+        
+        Args:
+            search_urls: URLs of the search results pages
+            
+        Returns:
+            List of job URLs
+        """
+        job_urls = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_url = {
+                executor.submit(self.extract_job_urls, url): url 
+                for url in search_urls
+            }
+            
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    urls = future.result()
+                    if urls:
+                        job_urls.extend(urls)
+                except Exception as e:
+                    self.logger.error(f"Error processing search page {url}: {str(e)}")
                     
-        return all_jobs
+        return job_urls
     
     @abstractmethod
     def extract_job_urls(self, search_url: str) -> List[str]:
@@ -3,6 +3,7 @@ Indeed.com.au job scraper implementation.
 """
 
 import logging
+from urllib.parse import quote_plus
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,6 +15,9 @@ from job_scraper.utils.utils import Utils
 
 logger = logging.getLogger(__name__)
 
+# Search results URL; keywords and location are query-string encoded
+_SEARCH_URL_TEMPLATE = "https://{domain}/jobs?q={keywords}&l={location}&start={start}"
+
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed.com.au job listings."""
     
@@ -22,6 +26,11 @@ class IndeedScraper(BaseScraper):
         super().__init__(config, logger)
         self.domain = "au.indeed.com"
         self.user_agent = config.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+        self.wait_timeout = self.config.get('timeout', 10)
+        
+        # Locator and wait condition are built once and reused for every page
+        self._container_locator = (By.CLASS_NAME, self.config.get('indeed_job_container', 'job_seen_beacon'))
+        self._container_present = EC.presence_of_element_located(self._container_locator)
     
     def get_search_urls(self, keywords: List[str], location: str, num_pages: int = 1) -> List[str]:
         """
@@ -36,11 +45,13 @@ class IndeedScraper(BaseScraper):
             List of search URLs
         """
         urls = []
+        encoded_location = quote_plus(location)
         for keyword in keywords:
+            encoded_keyword = quote_plus(keyword)
             for page in range(num_pages):
                 # Indeed uses 'start' parameter for pagination, with 10 jobs per page
                 start = page * 10
-                url = f"https://{self.domain}/jobs?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}&start={start}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=encoded_keyword, location=encoded_location, start=start)
                 urls.append(url)
         
         self.logger.info(f"Generated {len(urls)} search URLs for Indeed")
@@ -74,17 +85,14 @@ class IndeedScraper(BaseScraper):
             
             driver.get(search_url)
             
-            # Get job container selector from configuration
-            job_container = self.config.get('indeed_job_container', 'job_seen_beacon')
+            # Get title selector from configuration
             title_selector = self.config.get('indeed_title', 'jcs-JobTitle')
             
             # Wait for job listings to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, job_container))
-            )
+            WebDriverWait(driver, self.wait_timeout).until(self._container_present)
             
             # Get job cards
-            job_cards = driver.find_elements(By.CLASS_NAME, job_container)
+            job_cards = driver.find_elements(*self._container_locator)
             
             if not job_cards:
                 self.logger.warning(f"No job elements found on page {search_url}")
@@ -96,8 +104,9 @@ class IndeedScraper(BaseScraper):
                     title_element = job_card.find_element(By.CLASS_NAME, title_selector)
                     link_element = title_element.find_element(By.TAG_NAME, "a")
                     
-                    if link_element and link_element.get_attribute("href"):
-                        job_url = link_element.get_attribute("href")
+                    # Read the resolved href property once per card
+                    job_url = link_element.get_property("href")
+                    if job_url:
                         job_urls.append(job_url)
                 except Exception as e:
                     self.logger.error(f"Error extracting job URL: {str(e)}")
@@ -113,17 +122,17 @@ class IndeedScraper(BaseScraper):
                 
         return job_urls
     
-    def scrape(self, search_terms, location, num_pages=None):
+    def iter_jobs(self, search_terms, location, num_pages=None):
         """
-        Scrape job listings from Indeed.com.au.
+        Scrape job listings from Indeed.com.au, yielding each job as soon as it is parsed.
         
         Args:
             search_terms (list): List of job titles or keywords to search
             location (str): Location to search for jobs
             num_pages (int): Number of pages to scrape
             
-        Returns:
-            list: Job listings
+        Yields:
+            dict: Job listing
         """
         if num_pages is None:
             num_pages = self.config.get('max_pages', 3)
@@ -131,91 +140,91 @@ class IndeedScraper(BaseScraper):
         # Check if scraping is allowed
         if not self.check_site_allowed(self.domain):
             self.logger.warning(f"Scraping not allowed for {self.domain} according to robots.txt")
-            return self.job_listings
+            return
         
         self.logger.info(f"Scraping Indeed.com.au for {search_terms} in {location}...")
         
         # Get selectors from configuration
-        job_container = self.config.get('indeed_job_container', 'job_seen_beacon')
         title_selector = self.config.get('indeed_title', 'jcs-JobTitle')
         company_selector = self.config.get('indeed_company', 'companyName')
         location_selector = self.config.get('indeed_location', 'companyLocation')
+        card_selectors = {
+            'title': f".{title_selector}",
+            'company': f".{company_selector}",
+            'location': f".{location_selector}"
+        }
+        card_defaults = {'title': "No title", 'company': "No company", 'location': "No location"}
         
-        jobs_before = len(self.job_listings)
+        jobs_count = 0
+        
+        encoded_location = quote_plus(location)
         
         for search_term in search_terms:
+            encoded_keyword = quote_plus(search_term)
             for page in range(0, num_pages * 10, 10):  # Indeed uses 10 jobs per page
-                url = f"https://{self.domain}/jobs?q={search_term.replace(' ', '+')}&l={location.replace(' ', '+')}&start={page}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=encoded_keyword, location=encoded_location, start=page)
                 
                 # Add random delay
                 self.add_random_delay()
                 
                 try:
-                    driver = self.get_driver()
-                    driver.get(url)
-                    
-                    try:
-                        # Wait for job container to load
-                        WebDriverWait(driver, self.config.get('timeout', 10)).until(
-                            EC.presence_of_element_located((By.CLASS_NAME, job_container))
-                        )
+                    with self._driver_ctx() as driver:
+                        driver.get(url)
                         
-                        job_elements = driver.find_elements(By.CLASS_NAME, job_container)
-                        
-                        if not job_elements:
-                            self.logger.warning(f"No job elements found on page {page//10 + 1} for {search_term}. Selector might need updating.")
-                            driver.quit()
-                            continue
-                        
-                        for job in job_elements:
-                            try:
-                                # Use utility for safer element text extraction
-                                title = Utils.safe_get_element_text(job, By.CLASS_NAME, title_selector, "No title")
-                                company = Utils.safe_get_element_text(job, By.CLASS_NAME, company_selector, "No company")
-                                location = Utils.safe_get_element_text(job, By.CLASS_NAME, location_selector, "No location")
-                                
-                                # Get link from title element or any link
+                        try:
+                            # Wait for job container to load
+                            WebDriverWait(driver, self.wait_timeout).until(self._container_present)
+                            
+                            job_elements = driver.find_elements(*self._container_locator)
+                            
+                            if not job_elements:
+                                self.logger.warning(f"No job elements found on page {page//10 + 1} for {search_term}. Selector might need updating.")
+                                continue
+                            
+                            for job in job_elements:
                                 try:
-                                    title_element = job.find_element(By.CLASS_NAME, title_selector)
-                                    link = title_element.get_attribute("href")
-                                    if not link:
-                                        # Sometimes the title itself is not the link, but its parent is
-                                        parent = title_element.find_element(By.XPATH, "./..")
-                                        link = parent.get_attribute("href")
-                                except NoSuchElementException:
-                                    # Fallback to find any link
-                                    links = job.find_elements(By.TAG_NAME, "a")
-                                    link = next((l.get_attribute("href") for l in links if l.get_attribute("href")), "")
-                                
-                                # Create job data dictionary
-                                job_data = {
-                                    'title': title,
-                                    'company': company,
-                                    'location': location,
-                                    'link': link,
-                                    'source': 'Indeed'
-                                }
-                                
-                                # Add job to results
-                                self.job_listings.append(job_data)
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error parsing job: {e}", exc_info=True)
-                    
-                    except TimeoutException:
-                        self.logger.warning(f"Timeout waiting for Indeed jobs to load on page {page//10 + 1} for {search_term}")
-                    
-                    finally:
-                        driver.quit()
+                                    # Read all card fields in one round-trip
+                                    fields = Utils.safe_get_many(driver, card_selectors, root=job, defaults=card_defaults)
+                                    title = fields['title']
+                                    company = fields['company']
+                                    location = fields['location']
+                                    
+                                    # Get link from title element or any link
+                                    try:
+                                        title_element = job.find_element(By.CLASS_NAME, title_selector)
+                                        link = title_element.get_property("href")
+                                        if not link:
+                                            # Sometimes the title itself is not the link, but its parent is
+                                            parent = title_element.find_element(By.XPATH, "./..")
+                                            link = parent.get_property("href")
+                                    except NoSuchElementException:
+                                        # Fallback to find any link
+                                        links = job.find_elements(By.TAG_NAME, "a")
+                                        link = next((href for href in (l.get_property("href") for l in links) if href), "")
+                                    
+                                    # Create job data dictionary
+                                    job_data = {
+                                        'title': title,
+                                        'company': company,
+                                        'location': location,
+                                        'link': link,
+                                        'source': 'Indeed'
+                                    }
+                                    
+                                    # Hand the job to the caller straight away
+                                    jobs_count += 1
+                                    yield job_data
+                                    
+                                except Exception as e:
+                                    self.logger.error(f"Error parsing job: {e}", exc_info=True)
+                        
+                        except TimeoutException:
+                            self.logger.warning(f"Timeout waiting for Indeed jobs to load on page {page//10 + 1} for {search_term}")
                 
                 except Exception as e:
                     self.logger.error(f"Error scraping page {page//10 + 1} for {search_term}: {e}", exc_info=True)
-                    if 'driver' in locals():
-                        driver.quit()
         
-        indeed_jobs_count = len(self.job_listings) - jobs_before
-        self.logger.info(f"Found {indeed_jobs_count} job listings on Indeed")
-        return self.job_listings
+        self.logger.info(f"Found {jobs_count} job listings on Indeed")
     
     def get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
@@ -240,7 +249,7 @@ class IndeedScraper(BaseScraper):
                 driver.get(job_url)
                 
                 # Wait for the page to load
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, self.wait_timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
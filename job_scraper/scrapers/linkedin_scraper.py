@@ -2,8 +2,12 @@
 LinkedIn job scraper implementation.
 """
 
+import asyncio
+import json
 import logging
+import random
 import time
+from urllib.parse import quote_plus
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,10 +15,33 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from typing import List, Dict, Any, Optional
 
 from job_scraper.scrapers.base_scraper import BaseScraper
-from job_scraper.utils.utils import Utils
 
 logger = logging.getLogger(__name__)
 
+# Flag to track if Playwright is available
+PLAYWRIGHT_AVAILABLE = False
+
+try:
+    from playwright.async_api import async_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    logger.debug("Playwright is not available. LinkedIn scraping will use Selenium. Install with: pip install playwright")
+
+# Search results URL; keywords and location are query-string encoded
+_SEARCH_URL_TEMPLATE = "https://{domain}/jobs/search/?keywords={keywords}&location={location}&start={start}"
+
+# Subresources that are never needed to read job cards
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+# Maps job card elements to [title, company, location, link]; falls back to the
+# first link with an href when the card has no full-link anchor.
+_JOB_CARDS_FUNCTION = """(cards, sel) => cards.map(card => {
+    const text = s => { const el = card.querySelector(s); return el ? el.innerText : null; };
+    const link = card.querySelector('a.base-card__full-link') || card.querySelector('a[href]');
+    return [text(sel.title), text(sel.company), text(sel.location), link ? link.href : null];
+})"""
+
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job listings."""
     
@@ -23,6 +50,13 @@ class LinkedInScraper(BaseScraper):
         super().__init__(config, logger)
         self.domain = "www.linkedin.com"
         self.user_agent = config.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+        self.wait_timeout = self.config.get('timeout', 10)
+        
+        # Locators and wait conditions are built once and reused for every page
+        self._container_locator = (By.CLASS_NAME, self.config.get('linkedin_job_container', 'base-search-card'))
+        self._description_locator = (By.CLASS_NAME, self.config.get('linkedin_description', 'show-more-less-html__markup'))
+        self._container_present = EC.presence_of_element_located(self._container_locator)
+        self._description_present = EC.presence_of_element_located(self._description_locator)
     
     def get_search_urls(self, keywords: List[str], location: str, num_pages: int = 1) -> List[str]:
         """
@@ -37,11 +71,13 @@ class LinkedInScraper(BaseScraper):
             List of search URLs
         """
         urls = []
+        encoded_location = quote_plus(location)
         for keyword in keywords:
+            encoded_keyword = quote_plus(keyword)
             for page in range(1, num_pages + 1):
                 # LinkedIn uses 'start' parameter for pagination, with 25 jobs per page
                 start = (page - 1) * 25
-                url = f"https://{self.domain}/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&start={start}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=encoded_keyword, location=encoded_location, start=start)
                 urls.append(url)
         
         self.logger.info(f"Generated {len(urls)} search URLs for LinkedIn")
@@ -75,16 +111,11 @@ class LinkedInScraper(BaseScraper):
             
             driver.get(search_url)
             
-            # Get job container selector from configuration
-            job_container = self.config.get('linkedin_job_container', 'base-search-card')
-            
             # Wait for job listings to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, job_container))
-            )
+            WebDriverWait(driver, self.wait_timeout).until(self._container_present)
             
             # Get job cards
-            job_cards = driver.find_elements(By.CLASS_NAME, job_container)
+            job_cards = driver.find_elements(*self._container_locator)
             
             if not job_cards:
                 self.logger.warning(f"No job elements found on page {search_url}")
@@ -93,8 +124,9 @@ class LinkedInScraper(BaseScraper):
             for job_card in job_cards:
                 try:
                     link_element = job_card.find_element(By.TAG_NAME, "a")
-                    if link_element and link_element.get_attribute("href"):
-                        job_url = link_element.get_attribute("href")
+                    # Read the resolved href property once per card
+                    job_url = link_element.get_property("href")
+                    if job_url:
                         job_urls.append(job_url)
                 except Exception as e:
                     self.logger.error(f"Error extracting job URL: {str(e)}")
@@ -110,9 +142,97 @@ class LinkedInScraper(BaseScraper):
                 
         return job_urls
     
-    def scrape(self, search_terms, location, num_pages=None):
+    @staticmethod
+    def _card_selectors(title_selector: str, company_selector: str, location_selector: str) -> Dict[str, str]:
+        """Build the CSS selectors passed to the job card extraction script."""
+        return {
+            'title': '.' + title_selector,
+            'company': '.' + company_selector,
+            'location': '.' + location_selector
+        }
+    
+    @staticmethod
+    def _build_job_data(card: List[Optional[str]]) -> Dict[str, Any]:
+        """
+        Convert an extracted ``[title, company, location, link]`` entry to job data.
+        
+        Args:
+            card: Values returned by the job card extraction script
+            
+        Returns:
+            Job data dictionary
+        """
+        title, company, job_location, link = card
+        return {
+            'title': (title or '').strip() or "No title",
+            'company': (company or '').strip() or "No company",
+            'location': (job_location or '').strip() or "No location",
+            'link': link or "",
+            'source': 'LinkedIn'
+        }
+    
+    def _evaluate_job_cards(self, driver, job_container: str, title_selector: str,
+                            company_selector: str, location_selector: str) -> List[List[Optional[str]]]:
+        """
+        Extract title, company, location and link for every job card on the page.
+        
+        Runs a single ``Runtime.evaluate`` through the Chrome DevTools Protocol so
+        all cards are serialized to JSON in one round trip.
+        
+        Args:
+            driver: Active Chrome WebDriver
+            job_container: Class name of the job card container
+            title_selector: Class name of the title element
+            company_selector: Class name of the company element
+            location_selector: Class name of the location element
+            
+        Returns:
+            List of ``[title, company, location, link]`` entries, one per card
+        """
+        expression = "(%s)(Array.from(document.querySelectorAll(%s)), %s)" % (
+            _JOB_CARDS_FUNCTION,
+            json.dumps('.' + job_container),
+            json.dumps(self._card_selectors(title_selector, company_selector, location_selector))
+        )
+        response = driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True
+        })
+        return response.get('result', {}).get('value') or []
+    
+    def iter_jobs(self, search_terms, location, num_pages=None):
+        """
+        Scrape job listings from LinkedIn, yielding each job as soon as it is available.
+        
+        Uses Playwright when it is installed and falls back to Selenium when it is
+        not or when Playwright fails, for example because no browser is installed.
+        The Playwright path yields once all of its concurrent pages have loaded.
+        
+        Args:
+            search_terms (list): List of job titles or keywords to search
+            location (str): Location to search for jobs
+            num_pages (int): Number of pages to scrape
+            
+        Yields:
+            dict: Job listing
+        """
+        if PLAYWRIGHT_AVAILABLE:
+            try:
+                jobs = asyncio.run(self.scrape_async(search_terms, location, num_pages))
+            except Exception as e:
+                self.logger.error(f"Playwright scraping failed, falling back to Selenium: {str(e)}")
+            else:
+                yield from jobs
+                return
+                
+        yield from self._iter_jobs_selenium(search_terms, location, num_pages)
+    
+    async def scrape_async(self, search_terms, location, num_pages=None):
         """
-        Scrape job listings from LinkedIn.
+        Scrape job listings from LinkedIn with Playwright.
+        
+        One browser is launched per run and every search page is loaded in its
+        own browser context, concurrently up to ``max_workers`` at a time.
         
         Args:
             search_terms (list): List of job titles or keywords to search
@@ -120,7 +240,7 @@ class LinkedInScraper(BaseScraper):
             num_pages (int): Number of pages to scrape
             
         Returns:
-            list: Job listings
+            list: Job listings found in this run
         """
         if num_pages is None:
             num_pages = self.config.get('max_pages', 3)
@@ -128,7 +248,115 @@ class LinkedInScraper(BaseScraper):
         # Check if scraping is allowed
         if not self.check_site_allowed(self.domain):
             self.logger.warning(f"Scraping not allowed for {self.domain} according to robots.txt")
-            return self.job_listings
+            return []
+        
+        self.logger.info(f"Scraping LinkedIn for {search_terms} in {location}...")
+        
+        job_listings = []
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.config.get('headless', True))
+            try:
+                tasks = [
+                    self._scrape_page_async(browser, semaphore, search_term, location, page)
+                    for search_term in search_terms
+                    for page in range(0, num_pages * 25, 25)  # LinkedIn uses 25 jobs per page
+                ]
+                for page_jobs in await asyncio.gather(*tasks):
+                    job_listings.extend(page_jobs)
+            finally:
+                await browser.close()
+        
+        self.logger.info(f"Found {len(job_listings)} job listings on LinkedIn")
+        return job_listings
+    
+    async def _scrape_page_async(self, browser, semaphore, search_term, location, page):
+        """
+        Scrape a single LinkedIn search results page with Playwright.
+        
+        Args:
+            browser: Playwright browser instance
+            semaphore: Semaphore bounding the number of concurrent pages
+            search_term (str): Job title or keyword to search
+            location (str): Location to search for jobs
+            page (int): Offset of the first job on the page
+            
+        Returns:
+            list: Job listings found on the page
+        """
+        job_container = self.config.get('linkedin_job_container', 'base-search-card')
+        selectors = self._card_selectors(
+            self.config.get('linkedin_title', 'base-search-card__title'),
+            self.config.get('linkedin_company', 'base-search-card__subtitle'),
+            self.config.get('linkedin_location', 'job-search-card__location')
+        )
+        url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=quote_plus(search_term), location=quote_plus(location), start=page)
+        
+        async with semaphore:
+            # Add random delay
+            await asyncio.sleep(random.uniform(self.config.get('min_delay', 2), self.config.get('max_delay', 5)))
+            
+            context = await browser.new_context(user_agent=self.user_agent)
+            try:
+                browser_page = await context.new_page()
+                await browser_page.route("**/*", self._block_subresources)
+                await browser_page.goto(url)
+                
+                # Wait for job container to load
+                await browser_page.wait_for_selector('.' + job_container, timeout=self.config.get('timeout', 10) * 1000)
+                
+                # Scroll to load all jobs (dynamic loading)
+                for _ in range(5):
+                    await browser_page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+                    await asyncio.sleep(1)
+                
+                job_cards = await browser_page.eval_on_selector_all('.' + job_container, _JOB_CARDS_FUNCTION, selectors)
+                
+                if not job_cards:
+                    self.logger.warning(f"No job elements found on page {page//25 + 1} for {search_term}. Selector might need updating.")
+                    return []
+                
+                return [self._build_job_data(card) for card in job_cards]
+            
+            except PlaywrightTimeoutError:
+                self.logger.warning(f"Timeout waiting for LinkedIn jobs to load on page {page//25 + 1} for {search_term}")
+                return []
+            
+            except Exception as e:
+                self.logger.error(f"Error scraping page {page//25 + 1} for {search_term}: {e}", exc_info=True)
+                return []
+            
+            finally:
+                await context.close()
+    
+    @staticmethod
+    async def _block_subresources(route):
+        """Abort requests for subresources that are not needed to read job cards."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def _iter_jobs_selenium(self, search_terms, location, num_pages=None):
+        """
+        Scrape job listings from LinkedIn with Selenium, yielding them page by page.
+        
+        Args:
+            search_terms (list): List of job titles or keywords to search
+            location (str): Location to search for jobs
+            num_pages (int): Number of pages to scrape
+            
+        Yields:
+            dict: Job listing
+        """
+        if num_pages is None:
+            num_pages = self.config.get('max_pages', 3)
+        
+        # Check if scraping is allowed
+        if not self.check_site_allowed(self.domain):
+            self.logger.warning(f"Scraping not allowed for {self.domain} according to robots.txt")
+            return
         
         self.logger.info(f"Scraping LinkedIn for {search_terms} in {location}...")
         
@@ -138,82 +366,53 @@ class LinkedInScraper(BaseScraper):
         company_selector = self.config.get('linkedin_company', 'base-search-card__subtitle')
         location_selector = self.config.get('linkedin_location', 'job-search-card__location')
         
-        jobs_before = len(self.job_listings)
+        jobs_count = 0
+        
+        encoded_location = quote_plus(location)
         
         for search_term in search_terms:
+            encoded_keyword = quote_plus(search_term)
             for page in range(0, num_pages * 25, 25):  # LinkedIn uses 25 jobs per page
-                url = f"https://{self.domain}/jobs/search/?keywords={search_term.replace(' ', '%20')}&location={location.replace(' ', '%20')}&start={page}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=encoded_keyword, location=encoded_location, start=page)
                 
                 # Add random delay
                 self.add_random_delay()
                 
                 try:
-                    driver = self.get_driver()
-                    driver.get(url)
-                    
-                    try:
-                        # Wait for job container to load
-                        WebDriverWait(driver, self.config.get('timeout', 10)).until(
-                            EC.presence_of_element_located((By.CLASS_NAME, job_container))
-                        )
-                        
-                        # Scroll to load all jobs (dynamic loading)
-                        for _ in range(5):
-                            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(1)
-                        
-                        job_elements = driver.find_elements(By.CLASS_NAME, job_container)
+                    with self._driver_ctx() as driver:
+                        driver.get(url)
                         
-                        if not job_elements:
-                            self.logger.warning(f"No job elements found on page {page//25 + 1} for {search_term}. Selector might need updating.")
-                            driver.quit()
-                            continue
+                        try:
+                            # Wait for job container to load
+                            WebDriverWait(driver, self.wait_timeout).until(self._container_present)
+                            
+                            # Scroll to load all jobs (dynamic loading)
+                            for _ in range(5):
+                                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                                time.sleep(1)
+                            
+                            # Read every card in a single CDP round trip instead of
+                            # issuing one find_element call per field per card
+                            job_cards = self._evaluate_job_cards(
+                                driver, job_container, title_selector,
+                                company_selector, location_selector
+                            )
+                            
+                            if not job_cards:
+                                self.logger.warning(f"No job elements found on page {page//25 + 1} for {search_term}. Selector might need updating.")
+                                continue
+                            
+                            jobs_count += len(job_cards)
+                            for card in job_cards:
+                                yield self._build_job_data(card)
                         
-                        for job in job_elements:
-                            try:
-                                # Use utility for safer element text extraction
-                                title = Utils.safe_get_element_text(job, By.CLASS_NAME, title_selector, "No title")
-                                company = Utils.safe_get_element_text(job, By.CLASS_NAME, company_selector, "No company")
-                                location = Utils.safe_get_element_text(job, By.CLASS_NAME, location_selector, "No location")
-                                
-                                # Get link - LinkedIn usually has a reliable link class
-                                try:
-                                    link_element = job.find_element(By.CLASS_NAME, "base-card__full-link")
-                                    link = link_element.get_attribute("href")
-                                except NoSuchElementException:
-                                    # Fallback to find any link
-                                    links = job.find_elements(By.TAG_NAME, "a")
-                                    link = next((l.get_attribute("href") for l in links if l.get_attribute("href")), "")
-                                
-                                # Create job data dictionary
-                                job_data = {
-                                    'title': title,
-                                    'company': company,
-                                    'location': location,
-                                    'link': link,
-                                    'source': 'LinkedIn'
-                                }
-                                
-                                # Add job to results
-                                self.job_listings.append(job_data)
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error parsing job: {e}", exc_info=True)
-                    
-                    except TimeoutException:
-                        self.logger.warning(f"Timeout waiting for LinkedIn jobs to load on page {page//25 + 1} for {search_term}")
-                    
-                    finally:
-                        driver.quit()
+                        except TimeoutException:
+                            self.logger.warning(f"Timeout waiting for LinkedIn jobs to load on page {page//25 + 1} for {search_term}")
                 
                 except Exception as e:
                     self.logger.error(f"Error scraping page {page//25 + 1} for {search_term}: {e}", exc_info=True)
-                    if 'driver' in locals():
-                        driver.quit()
         
-        linkedin_jobs_count = len(self.job_listings) - jobs_before
-        self.logger.info(f"Found {linkedin_jobs_count} job listings on LinkedIn")
-        return self.job_listings
+        self.logger.info(f"Found {jobs_count} job listings on LinkedIn")
     
     def get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
@@ -238,7 +437,7 @@ class LinkedInScraper(BaseScraper):
                 driver.get(job_url)
                 
                 # Wait for the page to load
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, self.wait_timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
@@ -270,13 +469,9 @@ class LinkedInScraper(BaseScraper):
                     self.logger.warning(f"Could not find location for {job_url}")
                 
                 # Get description
-                description_selector = self.config.get('linkedin_description', 'show-more-less-html__markup')
                 try:
                     # Wait for description to load (LinkedIn is a SPA, so needs explicit wait)
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, description_selector))
-                    )
-                    description_element = driver.find_element(By.CLASS_NAME, description_selector)
+                    description_element = WebDriverWait(driver, self.wait_timeout).until(self._description_present)
                     description = description_element.text.strip()
                 except (TimeoutException, NoSuchElementException):
                     # Try alternative method - LinkedIn sometimes uses different selectors
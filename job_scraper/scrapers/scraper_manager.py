@@ -2,14 +2,27 @@
 Manager for job scraper implementations.
 """
 
+import os
+import queue
 import logging
-from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from typing import Dict, List, Any, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from job_scraper.scrapers.seek_scraper import SeekScraper
 from job_scraper.scrapers.indeed_scraper import IndeedScraper
 from job_scraper.scrapers.linkedin_scraper import LinkedInScraper
 
+# Supported job sites and the scraper class that handles each of them
+_SCRAPER_REGISTRY = {
+    'seek': SeekScraper,
+    'indeed': IndeedScraper,
+    'linkedin': LinkedInScraper
+}
+
+# Marker a scraper worker puts on the results queue once it has finished
+_SCRAPER_DONE = object()
+
 class ScraperManager:
     """Manages multiple job scraper implementations."""
     
@@ -23,35 +36,53 @@ class ScraperManager:
         """
         self.settings = settings
         self.logger = logger
-        self.scrapers = []
-        self._init_scrapers()
         
-    def _init_scrapers(self):
-        """Initialize supported scrapers based on configuration."""
-        job_sites = self.settings.get('job_sites', ['seek', 'indeed', 'linkedin'])
+    @cached_property
+    def scrapers(self) -> List[Any]:
+        """Scrapers for the configured job sites, built on first use and reused."""
+        return self._init_scrapers()
         
-        if 'seek' in job_sites:
-            try:
-                self.scrapers.append(SeekScraper(self.settings, self.logger))
-                self.logger.info("Initialized Seek scraper")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize Seek scraper: {str(e)}")
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by every search, created on first use."""
+        max_workers = max(1, min(len(self.scrapers), (os.cpu_count() or 1) * 4))
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
         
-        if 'indeed' in job_sites:
+    def close(self):
+        """Shut down the shared thread pool and release scraper resources."""
+        executor = self.__dict__.pop('_executor', None)
+        if executor:
+            executor.shutdown(wait=True)
+            
+        for scraper in self.__dict__.get('scrapers', []):
             try:
-                self.scrapers.append(IndeedScraper(self.settings, self.logger))
-                self.logger.info("Initialized Indeed scraper")
+                scraper.close()
             except Exception as e:
-                self.logger.error(f"Failed to initialize Indeed scraper: {str(e)}")
+                self.logger.error(f"Error closing {scraper.__class__.__name__}: {str(e)}")
+            
+    def __del__(self):
+        """Release the thread pool on deletion."""
+        try:
+            self.close()
+        except Exception:
+            pass
         
-        if 'linkedin' in job_sites:
+    def _init_scrapers(self) -> List[Any]:
+        """Initialize supported scrapers based on configuration."""
+        job_sites = self.settings.get('job_sites', list(_SCRAPER_REGISTRY))
+        scrapers = []
+        
+        for name, scraper_class in _SCRAPER_REGISTRY.items():
+            if name not in job_sites:
+                continue
             try:
-                self.scrapers.append(LinkedInScraper(self.settings, self.logger))
-                self.logger.info("Initialized LinkedIn scraper")
+                scrapers.append(scraper_class(self.settings, self.logger))
+                self.logger.info(f"Initialized {scraper_class.__name__}")
             except Exception as e:
-                self.logger.error(f"Failed to initialize LinkedIn scraper: {str(e)}")
+                self.logger.error(f"Failed to initialize {scraper_class.__name__}: {str(e)}")
         
-        self.logger.info(f"Initialized {len(self.scrapers)} job scrapers")
+        self.logger.info(f"Initialized {len(scrapers)} job scrapers")
+        return scrapers
         
     def search_jobs(self, keywords: List[str], location: str) -> List[Dict[str, Any]]:
         """
@@ -64,12 +95,27 @@ class ScraperManager:
         Returns:
             List of job dictionaries
         """
-        results = []
+        results = list(self.iter_jobs(keywords, location))
+        self.logger.info(f"Total jobs found: {len(results)}")
+        return results
+        
+    def iter_jobs(self, keywords: List[str], location: str) -> Iterator[Dict[str, Any]]:
+        """
+        Search for jobs using all configured scrapers, yielding each job as soon
+        as any scraper produces it.
+        
+        Args:
+            keywords: List of job keywords to search for
+            location: Location to search in
+            
+        Yields:
+            Job dictionary
+        """
         self.logger.info(f"Searching for jobs with keywords: {keywords}, location: {location}")
         
         if not self.scrapers:
             self.logger.warning("No job scrapers configured. Please check your settings.")
-            return results
+            return
             
         # Convert keywords to string if it's a list
         if isinstance(keywords, list):
@@ -77,27 +123,40 @@ class ScraperManager:
         else:
             keywords_str = keywords
         
-        # Use a ThreadPoolExecutor to run scrapers in parallel
-        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
-            # Create a future for each scraper
-            future_to_scraper = {
-                executor.submit(scraper.search_jobs, keywords_str, location): scraper 
-                for scraper in self.scrapers
-            }
-            
-            # Process results as they complete
-            for future in as_completed(future_to_scraper):
-                scraper = future_to_scraper[future]
-                try:
-                    # Get jobs found by this scraper
-                    scraper_results = future.result()
-                    if scraper_results:
-                        self.logger.info(f"Found {len(scraper_results)} jobs from {scraper.__class__.__name__}")
-                        results.extend(scraper_results)
-                    else:
-                        self.logger.info(f"No jobs found from {scraper.__class__.__name__}")
-                except Exception as e:
-                    self.logger.error(f"Error in {scraper.__class__.__name__}: {str(e)}")
+        # Each scraper streams its jobs onto a shared queue from the thread pool
+        results = queue.Queue()
+        for scraper in self.scrapers:
+            self._executor.submit(self._stream_scraper, scraper, keywords_str, location, results)
         
-        self.logger.info(f"Total jobs found: {len(results)}")
-        return results 
\ No newline at end of file
+        # Yield jobs as they arrive until every scraper has signalled completion
+        remaining = len(self.scrapers)
+        while remaining:
+            item = results.get()
+            if item is _SCRAPER_DONE:
+                remaining -= 1
+            else:
+                yield item
+                
+    def _stream_scraper(self, scraper: Any, keywords: str, location: str, results: queue.Queue):
+        """
+        Push every job found by a scraper onto the results queue.
+        
+        Args:
+            scraper: Scraper instance to run
+            keywords: Keywords to search for (space-separated string)
+            location: Location to search in
+            results: Queue receiving jobs followed by a completion marker
+        """
+        count = 0
+        try:
+            for job in scraper.iter_search_jobs(keywords, location):
+                results.put(job)
+                count += 1
+            if count:
+                self.logger.info(f"Found {count} jobs from {scraper.__class__.__name__}")
+            else:
+                self.logger.info(f"No jobs found from {scraper.__class__.__name__}")
+        except Exception as e:
+            self.logger.error(f"Error in {scraper.__class__.__name__}: {str(e)}")
+        finally:
+            results.put(_SCRAPER_DONE)
\ No newline at end of file
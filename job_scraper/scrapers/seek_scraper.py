@@ -2,9 +2,18 @@
 Seek.com.au job scraper implementation.
 """
 
+import asyncio
 import logging
+import random
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -16,6 +25,90 @@ from job_scraper.utils.utils import Utils
 
 logger = logging.getLogger(__name__)
 
+# Flag to track if Playwright is available
+PLAYWRIGHT_AVAILABLE = False
+
+try:
+    from playwright.async_api import async_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    logger.debug("Playwright is not available. Seek search pages will be loaded with Selenium. Install with: pip install playwright")
+
+# Possible selectors for job cards, tried in order
+JOB_CARD_SELECTORS = [
+    "article[data-card-type='JobCard']",
+    "article[data-automation='normalJob']",
+    "article._1wkzzau0.szuv5u.szuv5v._1wkzzau2._1wkzzav3"
+]
+
+# Single CSS selector group matching a job card of any known layout
+JOB_CARDS_CSS = ", ".join(JOB_CARD_SELECTORS)
+
+# Returns the unique first links of every card matched by the first selector
+# that finds any cards
+_JOB_LINKS_FUNCTION = """selectors => {
+    for (const selector of selectors) {
+        const cards = document.querySelectorAll(selector);
+        if (cards.length) {
+            return [...new Set(Array.from(cards, card => {
+                const link = card.querySelector('a[href]');
+                return link ? link.href : null;
+            }).filter(Boolean))];
+        }
+    }
+    return [];
+}"""
+
+# Same lookup wrapped for Selenium's execute_script
+_JOB_LINKS_SCRIPT = f"return ({_JOB_LINKS_FUNCTION})(arguments[0]);"
+
+# Job details kept per scraper, and how long before a listing is fetched again
+_JOB_DETAILS_CACHE_SIZE = 512
+_JOB_DETAILS_TTL = 1800  # 30 minutes in seconds, so edited or closed listings are refreshed
+
+# Hosts whose DNS lookups are cached, shared by every scraper run in the process
+_DNS_CACHED_HOSTS = frozenset({"www.seek.com.au"})
+_DNS_TTL = 300  # 5 minutes in seconds, so address rotation is picked up
+
+# Resolved addresses per lookup, with the time they expire
+_dns_cache: Dict[tuple, tuple] = {}
+_dns_lock = threading.Lock()
+
+_original_getaddrinfo = socket.getaddrinfo
+
+def _getaddrinfo(host, *args, **kwargs):
+    """socket.getaddrinfo replacement that caches lookups for Seek hosts only."""
+    if host not in _DNS_CACHED_HOSTS:
+        return _original_getaddrinfo(host, *args, **kwargs)
+        
+    key = (host, args, tuple(sorted(kwargs.items())))
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+        
+    # Failed lookups raise and are not cached
+    addresses = _original_getaddrinfo(host, *args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (time.monotonic() + _DNS_TTL, addresses)
+    return addresses
+
+def install_dns_cache():
+    """Route socket.getaddrinfo through the Seek DNS cache; safe to call repeatedly."""
+    socket.getaddrinfo = _getaddrinfo
+
+# Search results URL; keywords and location are hyphenated path segments
+_SEARCH_URL_TEMPLATE = "https://{domain}/{keywords}-jobs/in-{location}?page={page}"
+
+def _path_segment(value: str) -> str:
+    """Hyphenate and percent-encode a value for use in a Seek URL path."""
+    return quote(value.replace(' ', '-'), safe='')
+
+def _data_automation_value(selector: str) -> str:
+    """Extract the value from a ``[data-automation="..."]`` attribute selector."""
+    return selector.strip('[]').split('=')[1].strip('"')
+
 class SeekScraper(BaseScraper):
     """Scraper for Seek.com.au job listings."""
     
@@ -23,7 +116,49 @@ class SeekScraper(BaseScraper):
         """Initialize Seek scraper."""
         super().__init__(config, logger)
         self.domain = "www.seek.com.au"
+        install_dns_cache()
         self.user_agent = config.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+        self.wait_timeout = self.config.get('timeout', 10)
+        
+        # Job card selectors are constant for the scraper, so build the CSS once
+        company_attr = _data_automation_value(config.get('seek_company', '[data-automation="jobCompany"]'))
+        location_attr = _data_automation_value(config.get('seek_location', '[data-automation="jobLocation"]'))
+        self._job_container_css = f"article.{config.get('seek_job_container', '_1yhfl9r')}"
+        self._title_css = config.get('seek_title', 'h3')
+        self._company_css = f'span[data-automation="{company_attr}"]'
+        self._location_css = f'span[data-automation="{location_attr}"]'
+        
+        # Description class names combined into one CSS selector group
+        self._description_css = ', '.join(
+            '.' + name.strip() for name in config.get('seek_description', 'FYwKg,yvsb870').split(',')
+        )
+        
+        # Recently fetched job details with the time they expire, keyed by job
+        # URL and ordered from least to most recently used
+        self._job_details = OrderedDict()
+        self._job_details_lock = threading.Lock()
+        
+        # Keep-alive session so consecutive pages reuse the same connection
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': self.user_agent})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+    
+    def close(self):
+        """Close the HTTP session and quit any pooled WebDrivers."""
+        super().close()
+        self.session.close()
+        
+    def __del__(self):
+        """Release pooled connections and browsers on deletion."""
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def get_search_urls(self, keywords: List[str], location: str, num_pages: int = 1) -> List[str]:
         """
@@ -38,9 +173,11 @@ class SeekScraper(BaseScraper):
             List of search URLs
         """
         urls = []
+        location_segment = _path_segment(location)
         for keyword in keywords:
+            keyword_segment = _path_segment(keyword)
             for page in range(1, num_pages + 1):
-                url = f"https://{self.domain}/{keyword.replace(' ', '-')}-jobs/in-{location.replace(' ', '-')}?page={page}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=keyword_segment, location=location_segment, page=page)
                 urls.append(url)
         
         self.logger.info(f"Generated {len(urls)} search URLs for Seek.com.au")
@@ -70,32 +207,29 @@ class SeekScraper(BaseScraper):
             self.add_random_delay()
             
             # Requests approach might not work due to JavaScript, let's try with Selenium
-            driver = self.get_driver()
+            driver = self._acquire_driver()
             
             try:
                 driver.get(search_url)
                 self.logger.info("Loaded page with Selenium, waiting for content to load...")
                 
                 # Wait for the page to load
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, self.wait_timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
-                # Try several possible selectors for job listings
-                selectors_to_try = [
-                    "article[data-card-type='JobCard']",
-                    "article[data-automation='normalJob']",
-                    "article._1wkzzau0.szuv5u.szuv5v._1wkzzau2._1wkzzav3"
-                ]
+                # Read every card link in a single script call
+                job_urls.extend(driver.execute_script(_JOB_LINKS_SCRIPT, JOB_CARD_SELECTORS) or [])
                 
-                found_elements = False
-                for selector in selectors_to_try:
-                    self.logger.info(f"Trying selector: {selector}")
-                    job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if job_urls:
+                    self.logger.info(f"Found {len(job_urls)} job links with a single script call")
+                else:
+                    # Fall back to reading each card through WebDriver
+                    seen_urls = set()
+                    job_elements = driver.find_elements(By.CSS_SELECTOR, JOB_CARDS_CSS)
                     
                     if job_elements:
-                        self.logger.info(f"Found {len(job_elements)} job elements using selector: {selector}")
-                        found_elements = True
+                        self.logger.info(f"Found {len(job_elements)} job elements")
                         
                         for job in job_elements:
                             try:
@@ -120,28 +254,28 @@ class SeekScraper(BaseScraper):
                                     try:
                                         all_links = job.find_elements(By.TAG_NAME, "a")
                                         for link in all_links:
-                                            if link.get_attribute("href"):
+                                            if link.get_property("href"):
                                                 link_element = link
                                                 break
                                     except:
                                         pass
                                         
-                                if link_element and link_element.get_attribute("href"):
-                                    job_url = link_element.get_attribute("href")
+                                # Read the resolved href property once per card
+                                job_url = link_element.get_property("href") if link_element else None
+                                if job_url and job_url not in seen_urls:
+                                    seen_urls.add(job_url)
                                     job_urls.append(job_url)
                                     self.logger.debug(f"Found job URL: {job_url}")
                             except Exception as e:
                                 self.logger.error(f"Error getting job URL: {str(e)}")
                         
-                        break  # Break after finding job elements with a selector
-                
-                if not found_elements:
-                    self.logger.warning(f"No job elements found with any selector on {search_url}")
-                    # Log the page source for debugging
-                    self.logger.debug(f"Page source: {driver.page_source[:1000]}...")
+                    else:
+                        self.logger.warning(f"No job elements found with any selector on {search_url}")
+                        # Log the page source for debugging
+                        self.logger.debug(f"Page source: {driver.page_source[:1000]}...")
             
             finally:
-                driver.quit()
+                self._release_driver(driver)
                 
             self.logger.info(f"Found {len(job_urls)} job URLs on {search_url}")
         
@@ -149,18 +283,110 @@ class SeekScraper(BaseScraper):
             self.logger.error(f"Error extracting job URLs from {search_url}: {str(e)}")
             
         return job_urls
+    
+    def extract_job_urls_batch(self, search_urls: List[str]) -> List[str]:
+        """
+        Extract job URLs from several Seek.com.au search results pages.
+        
+        Uses one Playwright browser with parallel pages when Playwright is
+        installed and falls back to a Selenium session per page when it is
+        not or when Playwright fails.
+        
+        Args:
+            search_urls: URLs of the search results pages
+            
+        Returns:
+            List of job URLs
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            return super().extract_job_urls_batch(search_urls)
+            
+        # Check if scraping is allowed
+        if not self.check_site_allowed(self.domain):
+            self.logger.warning(f"Scraping not allowed for {self.domain} according to robots.txt")
+            return []
+            
+        try:
+            return asyncio.run(self.extract_job_urls_async(search_urls))
+        except Exception as e:
+            self.logger.error(f"Error extracting job URLs with Playwright, falling back to Selenium: {str(e)}")
+            return super().extract_job_urls_batch(search_urls)
+    
+    async def extract_job_urls_async(self, search_urls: List[str]) -> List[str]:
+        """
+        Extract job URLs from Seek.com.au search results pages with Playwright.
+        
+        One browser is launched per batch and pages are loaded concurrently,
+        up to ``seek_max_parallel_pages`` at a time.
+        
+        Args:
+            search_urls: URLs of the search results pages
+            
+        Returns:
+            List of job URLs
+        """
+        semaphore = asyncio.Semaphore(self.config.get('seek_max_parallel_pages', 3))
+        job_urls = []
+        
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.config.get('headless', True))
+            try:
+                tasks = [self._extract_job_urls_page_async(browser, semaphore, url) for url in search_urls]
+                for page_urls in await asyncio.gather(*tasks):
+                    job_urls.extend(page_urls)
+            finally:
+                await browser.close()
+                
+        return job_urls
+    
+    async def _extract_job_urls_page_async(self, browser, semaphore, search_url: str) -> List[str]:
+        """
+        Extract job URLs from a single Seek.com.au search results page with Playwright.
+        
+        Args:
+            browser: Playwright browser instance
+            semaphore: Semaphore bounding the number of concurrent pages
+            search_url: URL of the search results page
+            
+        Returns:
+            List of job URLs
+        """
+        async with semaphore:
+            # Add random delay to avoid getting blocked
+            await asyncio.sleep(random.uniform(self.config.get('min_delay', 2), self.config.get('max_delay', 5)))
+            
+            context = await browser.new_context(user_agent=self.user_agent)
+            try:
+                page = await context.new_page()
+                await page.goto(search_url, timeout=15000)
+                await page.wait_for_selector(JOB_CARDS_CSS, timeout=10000)
+                
+                job_urls = await page.evaluate(_JOB_LINKS_FUNCTION, JOB_CARD_SELECTORS)
+                self.logger.info(f"Found {len(job_urls)} job URLs on {search_url}")
+                return job_urls
+            
+            except PlaywrightTimeoutError:
+                self.logger.warning(f"No job elements found with any selector on {search_url}")
+                return []
+            
+            except Exception as e:
+                self.logger.error(f"Error extracting job URLs from {search_url}: {str(e)}")
+                return []
+            
+            finally:
+                await context.close()
             
-    def scrape(self, search_terms, location, num_pages=None):
+    def iter_jobs(self, search_terms, location, num_pages=None):
         """
-        Scrape job listings from Seek.com.au.
+        Scrape job listings from Seek.com.au, yielding each job as soon as it is parsed.
         
         Args:
             search_terms (list): List of job titles or keywords to search
             location (str): Location to search for jobs
             num_pages (int): Number of pages to scrape
             
-        Returns:
-            list: Job listings
+        Yields:
+            dict: Job listing
         """
         if num_pages is None:
             num_pages = self.config.get('max_pages', 3)
@@ -168,74 +394,141 @@ class SeekScraper(BaseScraper):
         # Check if scraping is allowed
         if not self.check_site_allowed(self.domain):
             self.logger.warning(f"Scraping not allowed for {self.domain} according to robots.txt")
-            return self.job_listings
+            return
         
         self.logger.info(f"Scraping Seek.com.au for {search_terms} in {location}...")
         
-        # Get selectors from configuration
-        job_container_selector = self.config.get('seek_job_container', '_1yhfl9r')
-        title_selector = self.config.get('seek_title', 'h3')
-        company_selector = self.config.get('seek_company', '[data-automation="jobCompany"]')
-        location_selector = self.config.get('seek_location', '[data-automation="jobLocation"]')
-        
-        jobs_before = len(self.job_listings)
+        location_segment = _path_segment(location)
         
+        # One task per search term and page so pages can be fetched independently
+        tasks = []
         for search_term in search_terms:
+            keyword_segment = _path_segment(search_term)
             for page in range(1, num_pages + 1):
-                url = f"https://{self.domain}/{search_term.replace(' ', '-')}-jobs/in-{location.replace(' ', '-')}?page={page}"
+                url = _SEARCH_URL_TEMPLATE.format(domain=self.domain, keywords=keyword_segment, location=location_segment, page=page)
+                tasks.append((search_term, page, url))
+        
+        jobs_count = 0
+        seen_links = set()
+        
+        # Fetch pages concurrently, capped to stay polite to the site
+        max_workers = max(1, min(len(tasks), self.config.get('seek_concurrency', 4)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._fetch_and_parse_page, *task) for task in tasks]
+            
+            for future in as_completed(futures):
+                for job_data in future.result():
+                    # The same job often shows up for several terms or pages
+                    link = job_data['link']
+                    if link:
+                        if link in seen_links:
+                            continue
+                        seen_links.add(link)
+                    jobs_count += 1
+                    yield job_data
+        
+        self.logger.info(f"Found {jobs_count} job listings on Seek")
+    
+    def _fetch_and_parse_page(self, search_term, page, url):
+        """
+        Fetch one Seek search results page and parse its job cards.
+        
+        Args:
+            search_term (str): Job title or keyword the page was searched for
+            page (int): Page number
+            url (str): URL of the search results page
+            
+        Returns:
+            list: Job listings found on the page
+        """
+        # Add random delay to avoid getting blocked
+        self.add_random_delay()
+        
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                soup = self.parse_html(response.content)
+                job_elements = soup.select(self._job_container_css)
                 
-                # Add random delay to avoid getting blocked
-                self.add_random_delay()
+                if not job_elements:
+                    self.logger.warning(f"No job elements found on page {page} for {search_term}. Selector might need updating.")
+                    return []
                 
-                try:
-                    response = requests.get(url, headers={'User-Agent': self.user_agent})
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        job_elements = soup.find_all('article', class_=job_container_selector)
+                page_jobs = []
+                for job in job_elements:
+                    try:
+                        title_element = job.select_one(self._title_css)
+                        title = title_element.text.strip() if title_element else "No title"
                         
-                        if not job_elements:
-                            self.logger.warning(f"No job elements found on page {page} for {search_term}. Selector might need updating.")
-                            continue
+                        company_element = job.select_one(self._company_css)
+                        company = company_element.text.strip() if company_element else "No company"
                         
-                        for job in job_elements:
-                            try:
-                                title_element = job.find(title_selector)
-                                title = title_element.text.strip() if title_element else "No title"
-                                
-                                company_element = job.find('span', {'data-automation': company_selector.strip('[]').split('=')[1].strip('"')})
-                                company = company_element.text.strip() if company_element else "No company"
-                                
-                                location_element = job.find('span', {'data-automation': location_selector.strip('[]').split('=')[1].strip('"')})
-                                location = location_element.text.strip() if location_element else "No location"
-                                
-                                link_element = job.find('a', href=True)
-                                link = "https://www.seek.com.au" + link_element['href'] if link_element else ""
-                                
-                                # Create job data dictionary
-                                job_data = {
-                                    'title': title,
-                                    'company': company,
-                                    'location': location,
-                                    'link': link,
-                                    'source': 'Seek'
-                                }
-                                
-                                # Add job to results
-                                self.job_listings.append(job_data)
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error parsing job: {e}", exc_info=True)
-                    else:
-                        self.logger.warning(f"Failed to fetch page {page} for {search_term}: {response.status_code}")
+                        location_element = job.select_one(self._location_css)
+                        location = location_element.text.strip() if location_element else "No location"
+                        
+                        link_element = job.select_one('a[href]')
+                        link = "https://www.seek.com.au" + link_element['href'] if link_element else ""
+                        
+                        # Create job data dictionary
+                        job_data = {
+                            'title': title,
+                            'company': company,
+                            'location': location,
+                            'link': link,
+                            'source': 'Seek'
+                        }
+                        
+                        # Add job to results
+                        page_jobs.append(job_data)
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error parsing job: {e}", exc_info=True)
                 
-                except Exception as e:
-                    self.logger.error(f"Error scraping page {page} for {search_term}: {e}", exc_info=True)
+                return page_jobs
+            else:
+                self.logger.warning(f"Failed to fetch page {page} for {search_term}: {response.status_code}")
+        
+        except Exception as e:
+            self.logger.error(f"Error scraping page {page} for {search_term}: {e}", exc_info=True)
         
-        seek_jobs_count = len(self.job_listings) - jobs_before
-        self.logger.info(f"Found {seek_jobs_count} job listings on Seek")
-        return self.job_listings
+        return []
     
+    def _cached_job_details(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get job details fetched earlier, if they have not expired.
+        
+        Args:
+            job_url: URL of the job listing
+            
+        Returns:
+            Cached job details, or None if not cached or expired
+        """
+        with self._job_details_lock:
+            entry = self._job_details.get(job_url)
+            if entry is None:
+                return None
+            expires, details = entry
+            if expires <= time.monotonic():
+                del self._job_details[job_url]
+                return None
+            self._job_details.move_to_end(job_url)
+            return details
+            
+    def _remember_job_details(self, job_url: str, details: Dict[str, Any]):
+        """
+        Cache job details, evicting the least recently used entry when full.
+        
+        Args:
+            job_url: URL of the job listing
+            details: Job details to cache
+        """
+        with self._job_details_lock:
+            self._job_details[job_url] = (time.monotonic() + _JOB_DETAILS_TTL, details)
+            self._job_details.move_to_end(job_url)
+            if len(self._job_details) > _JOB_DETAILS_CACHE_SIZE:
+                self._job_details.popitem(last=False)
+                
     def get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific job from Seek.com.au.
@@ -246,11 +539,16 @@ class SeekScraper(BaseScraper):
         Returns:
             Job details as a dictionary
         """
+        cached_details = self._cached_job_details(job_url)
+        if cached_details:
+            self.logger.debug(f"Using cached job details for: {job_url}")
+            return dict(cached_details)
+            
         try:
             self.logger.info(f"Getting job details for: {job_url}")
             
             # Get the job page
-            driver = self.get_driver()
+            driver = self._acquire_driver()
             
             try:
                 # Add random delay to avoid getting blocked
@@ -259,7 +557,7 @@ class SeekScraper(BaseScraper):
                 driver.get(job_url)
                 
                 # Wait for the page to load
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, self.wait_timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
@@ -290,16 +588,12 @@ class SeekScraper(BaseScraper):
                 except NoSuchElementException:
                     self.logger.warning(f"Could not find location for {job_url}")
                 
-                # Get description
-                description_selectors = self.config.get('seek_description', 'FYwKg,yvsb870').split(',')
-                for selector in description_selectors:
-                    try:
-                        description_element = driver.find_element(By.CLASS_NAME, selector.strip())
-                        description = description_element.text.strip()
-                        if description:
-                            break
-                    except NoSuchElementException:
-                        continue
+                # Get description from the first matching element with text
+                description_elements = driver.find_elements(By.CSS_SELECTOR, self._description_css)
+                description = next(
+                    (text for text in (element.text.strip() for element in description_elements) if text),
+                    ""
+                )
                 
                 # Create job details dictionary
                 job_details = {
@@ -311,10 +605,11 @@ class SeekScraper(BaseScraper):
                     'source': 'Seek'
                 }
                 
-                return job_details
+                self._remember_job_details(job_url, job_details)
+                return dict(job_details)
                 
             finally:
-                driver.quit()
+                self._release_driver(driver)
                 
         except Exception as e:
             self.logger.error(f"Error getting job details for {job_url}: {str(e)}")
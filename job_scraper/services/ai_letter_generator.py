@@ -8,19 +8,88 @@ import os
 import logging
 import json
 import hashlib
+import random
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Set
 
+import httpx
 import openai
 from openai import OpenAI
 
 from job_scraper.config.constants import Constants
 from job_scraper.utils.utils import validate_api_key
 
+# Number of cover letters kept in memory in front of the SQLite cache
+MEMORY_CACHE_SIZE = 128
+
+# Connection pool limits and timeout for requests to the OpenAI API
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+HTTP_TIMEOUT = 60.0
+
+# Retry limits for failed OpenAI requests
+MAX_RETRY_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 60.0
+
+SYSTEM_PROMPT = "You are an expert cover letter writer who creates personalized, professional cover letters."
+
+def _key_tuple(data: Dict[str, Any]) -> tuple:
+    """
+    Reduce cover letter input to the hashable fields that identify a letter.
+    
+    Args:
+        data: Data to use for cover letter generation
+        
+    Returns:
+        Tuple of job title, company name, truncated description and skills
+    """
+    skills = data.get('skills', '')
+    if isinstance(skills, (list, tuple, set)):
+        skills = tuple(sorted(str(skill) for skill in skills))
+        
+    return (
+        data.get('job_title', ''),
+        data.get('company_name', ''),
+        (data.get('description') or '')[:500],  # Truncate for stability
+        skills
+    )
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _cache_key_for(key_tuple: tuple) -> str:
+    """
+    Hash the identifying fields of a cover letter into a cache key.
+    
+    Args:
+        key_tuple: Tuple produced by _key_tuple
+        
+    Returns:
+        String hash to use as cache key
+    """
+    job_title, company_name, description, skills = key_tuple
+    cache_data = {
+        'job_title': job_title,
+        'company_name': company_name,
+        'description': description,
+        'skills': skills
+    }
+    
+    # Create a hash of the data
+    data_str = json.dumps(cache_data, sort_keys=True)
+    return hashlib.blake2b(data_str.encode(), digest_size=16).hexdigest()
+
 class AILetterGenerator:
     """AI-powered cover letter generator that tailors content to match resume with job descriptions."""
     
+    # HTTP connection pool shared by every generator instance in the process
+    _http_client: Optional[httpx.Client] = None
+    _http_client_lock = threading.Lock()
+    
+    # Cache directories already created in this process
+    _cache_dirs_ready: Set[str] = set()
+    
     def __init__(self, api_key: str, logger: Optional[logging.Logger] = None):
         """
         Initialize the AI letter generator.
@@ -34,15 +103,60 @@ class AILetterGenerator:
         self.client = self._initialize_client()
         self.cache_dir = os.path.join(Constants.APP_DIR, 'cache')
         self.cache_expiry = 60 * 60 * 24 * 7  # 7 days in seconds
+        self.max_backoff_seconds = MAX_BACKOFF_SECONDS
         self._ensure_cache_dir()
+        self._cache_lock = threading.Lock()
+        self._memory_cache = OrderedDict()
+        self._cache_db = self._open_cache_db()
     
     def _ensure_cache_dir(self):
         """Ensure cache directory exists."""
+        if self.cache_dir in AILetterGenerator._cache_dirs_ready:
+            return
+            
         try:
             os.makedirs(self.cache_dir, exist_ok=True)
+            AILetterGenerator._cache_dirs_ready.add(self.cache_dir)
             self.logger.debug(f"Cache directory ensured: {self.cache_dir}")
         except Exception as e:
             self.logger.error(f"Error creating cache directory: {str(e)}")
+            
+    def _open_cache_db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite cover letter cache, creating its table if needed."""
+        try:
+            conn = sqlite3.connect(os.path.join(self.cache_dir, 'letters.db'), check_same_thread=False)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS letters (
+                    cache_key TEXT PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    content TEXT NOT NULL
+                )
+            ''')
+            conn.commit()
+            return conn
+        except Exception as e:
+            self.logger.error(f"Error opening cache database: {str(e)}")
+            return None
+            
+    def close(self):
+        """Close the cache database."""
+        with self._cache_lock:
+            if self._cache_db:
+                self._cache_db.close()
+                self._cache_db = None
+                
+    def _remember(self, cache_key: str, entry: tuple):
+        """
+        Keep a cache entry in memory, evicting the least recently used one when full.
+        
+        Args:
+            cache_key: Cache key
+            entry: (timestamp, content) tuple
+        """
+        self._memory_cache[cache_key] = entry
+        self._memory_cache.move_to_end(cache_key)
+        if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
         
     def _initialize_client(self) -> Optional[OpenAI]:
         """Initialize the OpenAI client."""
@@ -55,11 +169,19 @@ class AILetterGenerator:
             return None
             
         try:
-            return OpenAI(api_key=self.api_key)
+            return OpenAI(api_key=self.api_key, http_client=self._shared_http_client())
         except Exception as e:
             self.logger.error(f"Error initializing OpenAI client: {str(e)}")
             return None
             
+    @classmethod
+    def _shared_http_client(cls) -> httpx.Client:
+        """Return the process-wide HTTP client, creating it on first use."""
+        with cls._http_client_lock:
+            if cls._http_client is None or cls._http_client.is_closed:
+                cls._http_client = httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            return cls._http_client
+            
     def _compute_cache_key(self, data: Dict[str, Any]) -> str:
         """
         Compute a cache key for the given data.
@@ -70,20 +192,8 @@ class AILetterGenerator:
         Returns:
             String hash to use as cache key
         """
-        # Create a stable string representation of the data
-        job_key = f"{data.get('job_title', '')}-{data.get('company_name', '')}"
-        
-        # Only include the most relevant parts for caching
-        cache_data = {
-            'job_title': data.get('job_title', ''),
-            'company_name': data.get('company_name', ''),
-            'description': data.get('description', '')[:500],  # Truncate for stability
-            'skills': data.get('skills', '')
-        }
-        
-        # Create a hash of the data
-        data_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        # Only the most relevant parts are used, and repeated inputs skip hashing
+        return _cache_key_for(_key_tuple(data))
         
     def _get_from_cache(self, cache_key: str) -> Optional[str]:
         """
@@ -95,22 +205,31 @@ class AILetterGenerator:
         Returns:
             Cached cover letter or None
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if not os.path.exists(cache_file):
-            return None
-            
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with self._cache_lock:
+                entry = self._memory_cache.get(cache_key)
+                if entry is not None:
+                    self._memory_cache.move_to_end(cache_key)
+                elif self._cache_db:
+                    entry = self._cache_db.execute(
+                        "SELECT timestamp, content FROM letters WHERE cache_key = ?",
+                        (cache_key,)
+                    ).fetchone()
+                    if entry is not None:
+                        self._remember(cache_key, entry)
+                        
+            if entry is None:
+                return None
                 
+            timestamp, content = entry
+            
             # Check if cache is expired
-            if time.time() - cache_data.get('timestamp', 0) > self.cache_expiry:
+            if time.time() - timestamp > self.cache_expiry:
                 self.logger.debug(f"Cache expired for key {cache_key}")
                 return None
                 
             self.logger.debug(f"Cache hit for key {cache_key}")
-            return cache_data.get('content')
+            return content
             
         except Exception as e:
             self.logger.error(f"Error reading cache: {str(e)}")
@@ -124,17 +243,18 @@ class AILetterGenerator:
             cache_key: Cache key
             content: Cover letter content
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
         try:
-            cache_data = {
-                'content': content,
-                'timestamp': time.time()
-            }
+            entry = (time.time(), content)
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f)
-                
+            with self._cache_lock:
+                self._remember(cache_key, entry)
+                if self._cache_db:
+                    with self._cache_db:
+                        self._cache_db.execute(
+                            "INSERT OR REPLACE INTO letters (cache_key, timestamp, content) VALUES (?, ?, ?)",
+                            (cache_key,) + entry
+                        )
+                        
             self.logger.debug(f"Cached content for key {cache_key}")
             
         except Exception as e:
@@ -150,55 +270,157 @@ class AILetterGenerator:
         Returns:
             Generated cover letter
         """
+        return "".join(self._cover_letter_chunks(data, stream_partial=False)).strip()
+        
+    def generate_cover_letter_stream(self, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate a personalized cover letter using AI, yielding text as it arrives.
+        
+        Cached and fallback letters are yielded as a single chunk. A streamed
+        letter is cached once it has been received in full. If the stream
+        fails part way, the text received so far is all the caller gets.
+        
+        Args:
+            data: Data to use for cover letter generation
+            
+        Yields:
+            Chunks of the generated cover letter
+        """
+        return self._cover_letter_chunks(data, stream_partial=True)
+        
+    def _cover_letter_chunks(self, data: Dict[str, Any], stream_partial: bool) -> Iterator[str]:
+        """
+        Generate a cover letter with a streamed completion request.
+        
+        Args:
+            data: Data to use for cover letter generation
+            stream_partial: Whether to yield text as it arrives. Otherwise the
+                letter is yielded only once received in full, and a stream
+                that fails part way is retried from scratch.
+            
+        Yields:
+            Chunks of the generated cover letter
+        """
         if not self.client:
             self.logger.warning("AI client not initialized, generating fallback cover letter")
-            return self._generate_fallback_cover_letter(data)
+            yield self._generate_fallback_cover_letter(data)
+            return
             
         # Check cache first
         cache_key = self._compute_cache_key(data)
         cached_content = self._get_from_cache(cache_key)
         
         if cached_content:
-            return cached_content
+            yield cached_content
+            return
             
         # Configure parameters based on AI settings
         try:
             prompt = self._prepare_prompt(data)
+            params = self._completion_params(data, prompt)
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {str(e)}")
+            yield self._generate_fallback_cover_letter(data)
+            return
             
-            # Make API request with exponential backoff
-            for attempt in range(3):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=data.get('model', 'gpt-3.5-turbo'),
-                        messages=[
-                            {"role": "system", "content": "You are an expert cover letter writer who creates personalized, professional cover letters."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=data.get('temperature', 0.7),
-                        max_tokens=data.get('max_tokens', 1000)
-                    )
-                    
-                    content = response.choices[0].message.content.strip()
-                    
-                    # Cache the response
-                    self._save_to_cache(cache_key, content)
-                    
-                    return content
-                    
-                except (openai.APIError, openai.RateLimitError) as e:
-                    self.logger.warning(f"OpenAI API error (attempt {attempt+1}/3): {str(e)}")
-                    if attempt < 2:
-                        time.sleep((2 ** attempt) * 1.5)  # Exponential backoff
-                    else:
-                        return self._generate_fallback_cover_letter(data)
+        # Make API request with exponential backoff
+        started = time.monotonic()
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            chunks = []
+            try:
+                response = self.client.chat.completions.create(stream=True, **params)
+                
+                for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content or ""
+                    if delta:
+                        chunks.append(delta)
+                        if stream_partial:
+                            yield delta
                         
-                except Exception as e:
-                    self.logger.error(f"Error generating cover letter: {str(e)}")
-                    return self._generate_fallback_cover_letter(data)
+                # Cache the response
+                content = "".join(chunks).strip()
+                self._save_to_cache(cache_key, content)
+                if not stream_partial:
+                    yield content
+                return
+                
+            except openai.APIError as e:
+                self.logger.warning(f"OpenAI API error (attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}): {str(e)}")
+                if chunks and stream_partial:
+                    # Part of the letter has already been handed to the caller
+                    return
+                delay = self._retry_delay(e, attempt, started)
+                if delay is None:
+                    yield self._generate_fallback_cover_letter(data)
+                    return
+                time.sleep(delay)
                     
-        except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            return self._generate_fallback_cover_letter(data)
+            except Exception as e:
+                self.logger.error(f"Error generating cover letter: {str(e)}")
+                if not (chunks and stream_partial):
+                    yield self._generate_fallback_cover_letter(data)
+                return
+            
+    def _retry_delay(self, error: openai.APIError, attempt: int, started: float) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a failed API request.
+        
+        Rate limited requests wait for the server's Retry-After header when it
+        is present, everything else backs off exponentially. Jitter is added so
+        concurrent requests do not retry in lockstep.
+        
+        Args:
+            error: Error raised by the OpenAI client
+            attempt: Zero-based number of the attempt that failed
+            started: time.monotonic() value when the first attempt was made
+            
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if attempt + 1 >= MAX_RETRY_ATTEMPTS:
+            return None
+            
+        # Client errors other than rate limits will fail the same way again
+        if isinstance(error, openai.APIStatusError) and not (
+                isinstance(error, openai.RateLimitError) or error.status_code >= 500):
+            return None
+            
+        delay = (2 ** attempt) * 1.5
+        response = getattr(error, 'response', None)
+        if response is not None:
+            try:
+                delay = float(response.headers.get('retry-after', delay))
+            except (TypeError, ValueError):
+                pass  # Retry-After given as an HTTP date
+                
+        delay += random.uniform(0, 0.5)
+        if time.monotonic() - started + delay > self.max_backoff_seconds:
+            return None
+            
+        return delay
+        
+    def _completion_params(self, data: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+        """
+        Build the chat completion request parameters.
+        
+        Args:
+            data: Data to use for cover letter generation
+            prompt: Formatted user prompt
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return {
+            'model': data.get('model', 'gpt-3.5-turbo'),
+            'messages': [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': data.get('temperature', 0.7),
+            'max_tokens': data.get('max_tokens', 1000)
+        }
             
     def _prepare_prompt(self, data: Dict[str, Any]) -> str:
         """
@@ -247,41 +469,39 @@ class AILetterGenerator:
         if not resume_data:
             return "No resume data provided."
             
-        formatted_data = "Resume Information:\n\n"
+        parts = ["Resume Information:\n\n"]
         
         # Add skills
         skills = resume_data.get('skills', [])
         if skills:
-            formatted_data += "Skills: " + ", ".join(skills) + "\n\n"
+            parts.append("Skills: " + ", ".join(skills) + "\n\n")
             
         # Add experience
         experience = resume_data.get('experience', [])
         if experience:
-            formatted_data += "Work Experience:\n"
+            parts.append("Work Experience:\n")
             for exp in experience:
                 company = exp.get('company', 'Unknown')
                 title = exp.get('title', 'Unknown')
                 period = exp.get('period', 'Unknown')
                 description = exp.get('description', '')
                 
-                formatted_data += f"- {title} at {company} ({period})\n"
+                parts.append(f"- {title} at {company} ({period})\n")
                 if description:
-                    formatted_data += f"  {description}\n"
-            formatted_data += "\n"
+                    parts.append(f"  {description}\n")
+            parts.append("\n")
             
         # Add education
         education = resume_data.get('education', [])
         if education:
-            formatted_data += "Education:\n"
-            for edu in education:
-                institution = edu.get('institution', 'Unknown')
-                degree = edu.get('degree', 'Unknown')
-                year = edu.get('year', 'Unknown')
-                
-                formatted_data += f"- {degree} from {institution} ({year})\n"
-            formatted_data += "\n"
+            parts.append("Education:\n")
+            parts.extend(
+                f"- {edu.get('degree', 'Unknown')} from {edu.get('institution', 'Unknown')} ({edu.get('year', 'Unknown')})\n"
+                for edu in education
+            )
+            parts.append("\n")
             
-        return formatted_data
+        return "".join(parts)
         
     def _generate_fallback_cover_letter(self, data: Dict[str, Any]) -> str:
         """
@@ -3,13 +3,19 @@ Job application manager module for managing job applications.
 """
 
 import os
+import sys
+import copy
 import json
 import time
+import sqlite3
+import queue
 import logging
+import threading
 import re
 import random
 import datetime
 import webbrowser
+from collections import Counter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -22,6 +28,8 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException, StaleElementReferenceException
 )
 from contextlib import contextmanager
+from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 from job_scraper.config.constants import Constants
@@ -30,6 +38,74 @@ from job_scraper.services.ai_letter_generator import AILetterGenerator
 
 logger = logging.getLogger(__name__)
 
+# Cover letter template used when the configured template cannot be read
+_DEFAULT_TEMPLATE = """
+[CURRENT_DATE]
+
+Dear Hiring Manager,
+
+I am writing to express my interest in the [JOB_TITLE] position at [COMPANY_NAME]. I was excited to see this opportunity as it aligns perfectly with my skills and career goals.
+
+[BODY_CONTENT]
+
+I am confident that my skills and experience make me a strong candidate for this position. I would welcome the opportunity to discuss how I can contribute to your team.
+
+Thank you for your consideration.
+
+Sincerely,
+[YOUR_NAME]
+[YOUR_EMAIL]
+[YOUR_PHONE]
+            """
+
+@lru_cache(maxsize=4)
+def _load_template(path):
+    """
+    Read a cover letter template, once per path for the whole process.
+    
+    Args:
+        path (str): Path to the cover letter template file
+        
+    Returns:
+        str: Template text
+    """
+    return Path(path).read_text(encoding='utf-8')
+
+# Placeholders filled in by the fallback cover letter generator
+_PLACEHOLDER_RE = re.compile(
+    r'\[(COMPANY_NAME|JOB_TITLE|JOB_ID|CURRENT_DATE|YOUR_NAME|YOUR_EMAIL|YOUR_PHONE|BODY_CONTENT)\]'
+)
+
+@lru_cache(maxsize=4)
+def _compile_template(template):
+    """
+    Split a cover letter template into literal text and placeholder names.
+    
+    Args:
+        template (str): Cover letter template
+        
+    Returns:
+        tuple: Literal text at even indices and placeholder names at odd indices
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+@lru_cache(maxsize=2)
+def _date_string(ordinal):
+    """
+    Format a date for use in cover letters.
+    
+    Args:
+        ordinal (int): Proleptic Gregorian ordinal of the date
+        
+    Returns:
+        str: Date formatted like 'January 01, 2024'
+    """
+    return datetime.date.fromordinal(ordinal).strftime('%B %d, %Y')
+
+def _today_string():
+    """Return today's date formatted for use in cover letters."""
+    return _date_string(datetime.date.today().toordinal())
+
 class RetryableError(Exception):
     """Exception that can be retried."""
     pass
@@ -41,17 +117,16 @@ class ApplicationError(Exception):
 class WebDriverManager:
     """Context manager for handling Selenium WebDriver resources."""
     
-    def __init__(self, options=None):
+    def __init__(self, options=None, chrome_driver_path=None):
         self.options = options or Options()
+        self.chrome_driver_path = chrome_driver_path
         self.driver = None
         
     def __enter__(self):
         try:
-            chrome_driver_path = self.config.get('chrome_driver_path') if hasattr(self, 'config') else None
-            
-            if chrome_driver_path:
+            if self.chrome_driver_path:
                 # Use specified Chrome driver path
-                service = Service(executable_path=chrome_driver_path)
+                service = Service(executable_path=self.chrome_driver_path)
                 self.driver = webdriver.Chrome(service=service, options=self.options)
             else:
                 # Use ChromeDriverManager to automatically download and manage the driver
@@ -69,13 +144,163 @@ class WebDriverManager:
                 self.driver.quit()
             except Exception as e:
                 logging.error(f"Error while closing WebDriver: {str(e)}")
+            self.driver = None
+
+class BrowserPool:
+    """Bounded pool of reusable Chrome browsers backed by WebDriverManager."""
+    
+    def __init__(self, options=None, chrome_driver_path=None, size=3, max_pages_per_browser=50,
+                 profile_dir=None):
+        """
+        Initialize the browser pool.
+        
+        Browsers are started on first use and kept open for later applications.
+        
+        Args:
+            options: Chrome options used for every browser in the pool
+            chrome_driver_path (str): Optional path to the Chrome driver executable
+            size (int): Maximum number of browsers open at the same time
+            max_pages_per_browser (int): Number of uses after which a browser is
+                restarted to release memory leaked by Chrome
+            profile_dir (str): Optional directory holding one persistent Chrome
+                profile per pool slot, so restarted browsers start warm
+        """
+        self.options = options or Options()
+        self.chrome_driver_path = chrome_driver_path
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.profile_dir = profile_dir
+        self._idle = queue.Queue()
+        self._slots = threading.Semaphore(size)
+        
+        # Chrome locks a profile to one running browser, so each open browser
+        # takes its own profile number and gives it back when it quits
+        self._free_profiles = queue.Queue()
+        for profile in range(size):
+            self._free_profiles.put(profile)
+            
+    def _start_browser(self):
+        """
+        Start a new browser, using a free persistent profile if configured.
+        
+        Returns:
+            list: The WebDriverManager, the number of pages it has served and its profile number
+        """
+        options = self.options
+        profile = None
+        if self.profile_dir:
+            try:
+                profile = self._free_profiles.get_nowait()
+                options = copy.deepcopy(self.options)
+                options.add_argument(f"--user-data-dir={os.path.join(self.profile_dir, str(profile))}")
+            except queue.Empty:
+                pass
+                
+        manager = WebDriverManager(options, self.chrome_driver_path)
+        try:
+            manager.__enter__()
+        except Exception:
+            if profile is not None:
+                self._free_profiles.put(profile)
+            raise
+        return [manager, 0, profile]
+        
+    def _quit_browser(self, entry):
+        """
+        Quit a browser and release its profile.
+        
+        Args:
+            entry (list): Entry returned by _start_browser
+        """
+        manager, _, profile = entry
+        manager.__exit__(None, None, None)
+        if profile is not None:
+            self._free_profiles.put(profile)
+        
+    def _checkout(self):
+        """
+        Take a healthy browser from the pool, starting a new one if none is idle.
+        
+        Returns:
+            list: Entry holding the WebDriverManager, its page count and profile number
+        """
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                return self._start_browser()
+                
+            try:
+                # Probe the browser, it may have been closed by the user
+                entry[0].driver.current_url
+                return entry
+            except WebDriverException:
+                logger.debug("Discarding unresponsive browser from pool")
+                self._quit_browser(entry)
+                
+    def _checkin(self, entry, healthy=True):
+        """
+        Return a browser to the pool, or quit it if it is worn out or broken.
+        
+        Args:
+            entry (list): Entry returned by _checkout
+            healthy (bool): False if the browser raised a WebDriver error
+        """
+        manager = entry[0]
+        entry[1] += 1
+        
+        if healthy and entry[1] < self.max_pages_per_browser:
+            try:
+                manager.driver.get('about:blank')
+                self._idle.put(entry)
+                return
+            except WebDriverException:
+                pass
+                
+        self._quit_browser(entry)
+        
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a browser from the pool for the duration of a with block.
+        
+        Yields:
+            WebDriver: Browser ready for use
+        """
+        self._slots.acquire()
+        try:
+            entry = self._checkout()
+            try:
+                yield entry[0].driver
+            except WebDriverException:
+                self._checkin(entry, healthy=False)
+                raise
+            except BaseException:
+                self._checkin(entry)
+                raise
+            else:
+                self._checkin(entry)
+        finally:
+            self._slots.release()
+            
+    def close(self):
+        """Quit every idle browser in the pool."""
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_browser(entry)
 
 class JobApplicationManager:
     """
     Class for managing job applications.
     """
     
-    def __init__(self, resume_path, cover_letter_template_path, config_manager):
+    # Output directories already created in this process
+    _dirs_ready = set()
+    
+    def __init__(self, resume_path, cover_letter_template_path, config_manager, pool=None):
         """
         Initialize the job application manager.
         
@@ -83,12 +308,14 @@ class JobApplicationManager:
             resume_path (str): Path to the resume file
             cover_letter_template_path (str): Path to the cover letter template file
             config_manager: Configuration manager instance
+            pool (BrowserPool): Optional browser pool to open application pages in
         """
         logger.info("Initializing JobApplicationManager")
         self.resume_path = resume_path
         self.config = config_manager
         self.applications_log_path = Constants.APPLICATIONS_LOG
-        self.applied_jobs = self._load_applied_jobs()
+        self._applied_lock = threading.Lock()
+        self._db = self._open_db()
         
         # Initialize AI letter generator
         api_key = self.config.get_config('openai_api_key', '')
@@ -96,29 +323,11 @@ class JobApplicationManager:
         
         # Load cover letter template
         try:
-            with open(cover_letter_template_path, 'r', encoding='utf-8') as file:
-                self.cover_letter_template = file.read()
+            self.cover_letter_template = _load_template(cover_letter_template_path)
             logger.debug("Cover letter template loaded")
         except Exception as e:
             logger.error(f"Error loading cover letter template: {e}", exc_info=True)
-            self.cover_letter_template = """
-[CURRENT_DATE]
-
-Dear Hiring Manager,
-
-I am writing to express my interest in the [JOB_TITLE] position at [COMPANY_NAME]. I was excited to see this opportunity as it aligns perfectly with my skills and career goals.
-
-[BODY_CONTENT]
-
-I am confident that my skills and experience make me a strong candidate for this position. I would welcome the opportunity to discuss how I can contribute to your team.
-
-Thank you for your consideration.
-
-Sincerely,
-[YOUR_NAME]
-[YOUR_EMAIL]
-[YOUR_PHONE]
-            """
+            self.cover_letter_template = _DEFAULT_TEMPLATE
             logger.warning("Using default cover letter template")
         
         # Configure Chrome options for Selenium
@@ -127,15 +336,127 @@ Sincerely,
         self.chrome_options.add_argument("--disable-gpu")
         self.chrome_options.add_argument("--no-sandbox")
         self.chrome_options.add_argument("--disable-dev-shm-usage")
+        self.chrome_options.add_argument("--disable-extensions")
+        self.chrome_options.add_argument("--disable-background-networking")
+        self.chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        self.chrome_options.add_argument("--disk-cache-size=52428800")  # 50 MB
+        
+        # Return from driver.get() once the DOM is ready instead of waiting for
+        # trackers and ads to finish loading; completion is detected with explicit waits
+        self.chrome_options.page_load_strategy = 'eager'
+        
+        # Images stay on by default since the application forms are filled in by hand
+        if self.config.get_config('disable_images', False):
+            self.chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            self.chrome_options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2}
+            )
+        
+        # Seconds to wait for an application to be submitted
+        self.application_timeout = self.config.get_config('application_timeout', 300)
+        
+        # Keep browsers open between applications instead of starting one per job
+        self.pool = pool or BrowserPool(
+            self.chrome_options,
+            chrome_driver_path=self.config.get_config('chrome_driver_path', None),
+            size=self.config.get_config('browser_pool_size', 3),
+            max_pages_per_browser=self.config.get_config('max_pages_per_browser', 50),
+            # Persistent profiles are opt-in: a shared default directory would
+            # mix cookies and logins between users and processes
+            profile_dir=self.config.get_config('chrome_profile_dir', None)
+        )
+        
+    def close(self):
+        """Quit the browsers kept open by the application manager and close its databases."""
+        self.pool.close()
+        self.ai_letter_generator.close()
+        with self._applied_lock:
+            self._db.close()
+            
+    def _open_db(self):
+        """
+        Open the applications database, importing the JSON log on first run.
+        
+        Returns:
+            sqlite3.Connection: Connection to the applications database
+        """
+        try:
+            os.makedirs(os.path.dirname(Constants.APPLICATIONS_DB), exist_ok=True)
+            conn = sqlite3.connect(Constants.APPLICATIONS_DB, isolation_level=None, check_same_thread=False)
+        except Exception as e:
+            logger.error(f"Error opening applications database: {e}", exc_info=True)
+            conn = sqlite3.connect(':memory:', isolation_level=None, check_same_thread=False)
+            
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS applications (
+                job_id TEXT PRIMARY KEY,
+                company TEXT,
+                title TEXT,
+                link TEXT,
+                applied_date TEXT
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_applications_applied_date ON applications (applied_date)')
+        
+        # Import applications recorded by earlier versions in the JSON log
+        if conn.execute('SELECT 1 FROM applications LIMIT 1').fetchone() is None:
+            applied_jobs = self._load_applied_jobs()
+            if applied_jobs:
+                conn.execute('BEGIN')
+                conn.executemany(
+                    'INSERT OR IGNORE INTO applications (job_id, company, title, link, applied_date) VALUES (?, ?, ?, ?, ?)',
+                    [
+                        (job_id, job.get('company', 'Unknown'), job.get('title', 'Unknown'),
+                         job.get('link', ''), job.get('applied_date', ''))
+                        for job_id, job in applied_jobs.items()
+                    ]
+                )
+                conn.execute('COMMIT')
+                logger.info(f"Imported {len(applied_jobs)} applications from {self.applications_log_path}")
+                
+        return conn
+        
+    @staticmethod
+    def _job_id(job_data):
+        """
+        Build the ID applications are recorded under.
+        
+        The ID is interned so repeated lookups of the same job reuse one string.
+        
+        Args:
+            job_data (dict): Job data
+            
+        Returns:
+            str: Job ID made of the company name and job title
+        """
+        return sys.intern(f"{job_data.get('company', '')}_{job_data.get('title', '')}")
+        
+    def _applied_date(self, job_id):
+        """
+        Get the date a job was applied to.
+        
+        Args:
+            job_id (str): Job ID
+            
+        Returns:
+            str: Application date, or None if the job has not been applied to
+        """
+        with self._applied_lock:
+            row = self._db.execute(
+                'SELECT applied_date FROM applications WHERE job_id = ? LIMIT 1', (job_id,)
+            ).fetchone()
+        return row[0] if row else None
     
     def _load_applied_jobs(self):
         """
-        Load previously applied jobs from log file.
+        Load previously applied jobs from the JSON log file.
         
         Returns:
             dict: Dictionary of applied jobs
         """
-        logger.debug(f"Loading applied jobs from {self.applications_log_path}")
+        logger.debug("Loading applied jobs from %s", self.applications_log_path)
         if os.path.exists(self.applications_log_path):
             try:
                 with open(self.applications_log_path, 'r', encoding='utf-8') as file:
@@ -145,15 +466,6 @@ Sincerely,
                 return {}
         return {}
     
-    def _save_applied_jobs(self):
-        """Save applied jobs to log file."""
-        logger.debug(f"Saving applied jobs to {self.applications_log_path}")
-        try:
-            with open(self.applications_log_path, 'w', encoding='utf-8') as file:
-                json.dump(self.applied_jobs, file, ensure_ascii=False, indent=4)
-        except Exception as e:
-            logger.error(f"Error saving applied jobs log: {e}", exc_info=True)
-    
     def show_job_details(self, job_data):
         """
         Show detailed job information.
@@ -161,34 +473,37 @@ Sincerely,
         Args:
             job_data (dict): Job data
         """
-        logger.debug(f"Showing job details for {job_data.get('title', 'Unknown')}")
-        # Print job details to console
-        print("\n" + "="*60)
-        print(f"Job Title: {job_data.get('title', 'Unknown')}")
-        print(f"Company: {job_data.get('company', 'Unknown')}")
-        print(f"Location: {job_data.get('location', 'Unknown')}")
-        print(f"Source: {job_data.get('source', 'Unknown')}")
+        title = job_data.get('title', 'Unknown')
+        logger.debug("Showing job details for %s", title)
+        # Print job details to console in a single write
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append(f"Job Title: {title}")
+        lines.append(f"Company: {job_data.get('company', 'Unknown')}")
+        lines.append(f"Location: {job_data.get('location', 'Unknown')}")
+        lines.append(f"Source: {job_data.get('source', 'Unknown')}")
         
         if 'match_score' in job_data:
-            print(f"Match Score: {job_data['match_score']}%")
+            lines.append(f"Match Score: {job_data['match_score']}%")
         
         if 'missing_skills' in job_data and job_data['missing_skills']:
-            print("\nMissing Skills:")
+            lines.append("\nMissing Skills:")
             for skill in job_data['missing_skills']:
-                print(f"- {skill}")
+                lines.append(f"- {skill}")
         else:
-            print("\nYour resume matches all the required skills!")
+            lines.append("\nYour resume matches all the required skills!")
         
-        print("\nDescription Preview:")
+        lines.append("\nDescription Preview:")
         if 'description' in job_data and job_data['description']:
             description_preview = job_data['description'][:500] + "..." if len(job_data['description']) > 500 else job_data['description']
-            print(description_preview)
+            lines.append(description_preview)
         else:
-            print("No description available")
+            lines.append("No description available")
         
-        print("\nJob Link:")
-        print(job_data.get('link', 'No link available'))
-        print("="*60 + "\n")
+        lines.append("\nJob Link:")
+        lines.append(job_data.get('link', 'No link available'))
+        lines.append("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def ask_for_application_decision(self, job_data):
         """
@@ -201,9 +516,10 @@ Sincerely,
             bool: True if user wants to apply, False otherwise
         """
         # Check if already applied
-        job_id = f"{job_data.get('company', '')}_{job_data.get('title', '')}"
-        if job_id in self.applied_jobs:
-            print(f"\nYou've already applied to this job on {self.applied_jobs[job_id]['applied_date']}")
+        job_id = self._job_id(job_data)
+        applied_date = self._applied_date(job_id)
+        if applied_date is not None:
+            print(f"\nYou've already applied to this job on {applied_date}")
             return False
         
         # Show job details
@@ -229,13 +545,13 @@ Sincerely,
         Returns:
             str: Customized cover letter
         """
-        logger.debug(f"Generating cover letter for {job_data.get('title', 'Unknown')} at {job_data.get('company', 'Unknown')}")
+        logger.debug("Generating cover letter for %s at %s", job_data.get('title', 'Unknown'), job_data.get('company', 'Unknown'))
         # Prepare data for AI generation
         resume_data = {
             'name': self.config.get_config('name', 'Your Name'),
             'email': self.config.get_config('email', 'your.email@example.com'),
             'phone': self.config.get_config('phone', '555-555-5555'),
-            'current_date': datetime.datetime.now().strftime('%B %d, %Y'),
+            'current_date': _today_string(),
             'skills': self.config.get_config('skills', []),
             'work_experience': self.config.get_config('experience', []),
             'education': self.config.get_config('education', []),
@@ -268,26 +584,14 @@ Sincerely,
         Returns:
             str: Customized cover letter
         """
-        # Create a copy of the template
-        letter = self.cover_letter_template
-        
-        # Replace placeholders
-        letter = letter.replace('[COMPANY_NAME]', job_data.get('company', 'the Company'))
-        letter = letter.replace('[JOB_TITLE]', job_data.get('title', 'the position'))
-        letter = letter.replace('[JOB_ID]', str(job_data.get('id', '')))
-        letter = letter.replace('[CURRENT_DATE]', datetime.datetime.now().strftime('%B %d, %Y'))
-        
-        # Add personal info
-        letter = letter.replace('[YOUR_NAME]', self.config.get_config('name', 'Your Name'))
-        letter = letter.replace('[YOUR_EMAIL]', self.config.get_config('email', 'your.email@example.com'))
-        letter = letter.replace('[YOUR_PHONE]', self.config.get_config('phone', '555-555-5555'))
+        title = job_data.get('title', 'the position')
         
         # Create a basic custom paragraph based on skills
         skills = self.config.get_config('skills', [])
         if skills:
             skills_text = ', '.join(skills[:5])  # Use first 5 skills
             custom_paragraph = f"""
-            I am excited to apply for the {job_data.get('title', 'the position')} position at {job_data.get('company', 'your company')}. 
+            I am excited to apply for the {title} position at {job_data.get('company', 'your company')}. 
             Based on my review of the job description, I believe my skills in {skills_text} 
             make me a strong candidate for this role. My previous experience has prepared me 
             to contribute effectively to your team from day one. I am particularly interested 
@@ -300,10 +604,21 @@ Sincerely,
             confident that I can make a positive impact in this role.
             """
         
-        # Replace body content
-        letter = letter.replace('[BODY_CONTENT]', custom_paragraph)
+        replacements = {
+            'COMPANY_NAME': job_data.get('company', 'the Company'),
+            'JOB_TITLE': title,
+            'JOB_ID': str(job_data.get('id', '')),
+            'CURRENT_DATE': _today_string(),
+            'YOUR_NAME': self.config.get_config('name', 'Your Name'),
+            'YOUR_EMAIL': self.config.get_config('email', 'your.email@example.com'),
+            'YOUR_PHONE': self.config.get_config('phone', '555-555-5555'),
+            'BODY_CONTENT': custom_paragraph
+        }
         
-        return letter
+        # Fill the placeholder slots of the pre-split template and join once
+        parts = list(_compile_template(self.cover_letter_template))
+        parts[1::2] = [replacements[name] for name in parts[1::2]]
+        return ''.join(parts)
     
     def save_cover_letter(self, job_data, cover_letter):
         """
@@ -316,15 +631,17 @@ Sincerely,
         Returns:
             str: Path to saved cover letter file
         """
-        logger.debug(f"Saving cover letter for {job_data.get('title', 'Unknown')} at {job_data.get('company', 'Unknown')}")
+        logger.debug("Saving cover letter for %s at %s", job_data.get('title', 'Unknown'), job_data.get('company', 'Unknown'))
         # Create output directory if it doesn't exist
         output_dir = Constants.COVER_LETTERS_DIR
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in JobApplicationManager._dirs_ready:
+            os.makedirs(output_dir, exist_ok=True)
+            JobApplicationManager._dirs_ready.add(output_dir)
         
         # Generate filename using sanitized company name and job title
         company_name = Utils.sanitize_filename(job_data.get('company', 'company'))
         job_title = Utils.sanitize_filename(job_data.get('title', 'job'))
-        filename = f"{output_dir}/cover_letter_{company_name}_{job_title}.txt"
+        filename = os.path.join(output_dir, f"cover_letter_{company_name}_{job_title}.txt")
         
         # Save cover letter
         try:
@@ -337,68 +654,129 @@ Sincerely,
             logger.error(f"Error saving cover letter: {e}", exc_info=True)
             return None
     
-    def apply_to_job(self, job_data):
+    def apply_to_job(self, job_data, interactive=False):
         """
         Apply to a job.
         
+        The browser is watched until the site shows the application has been
+        submitted, for up to ``application_timeout`` seconds.
+        
         Args:
             job_data (dict): Job data
+            interactive (bool): Wait for the user to press Enter in the
+                terminal instead of watching the browser
             
         Returns:
             bool: True if application successful, False otherwise
         """
         logger.info(f"Applying to job: {job_data.get('title', 'Unknown')} at {job_data.get('company', 'Unknown')}")
         
-        # Generate cover letter
-        cover_letter = self.generate_cover_letter(job_data)
-        cover_letter_path = self.save_cover_letter(job_data, cover_letter)
-        
+        cover_letter_path = self._prepare_application(job_data)
         if not cover_letter_path:
             logger.error("Failed to save cover letter")
             return False
-        
-        # Open job application page
-        try:
-            chrome_driver_path = self.config.get_config('chrome_driver_path', None)
-            
-            if chrome_driver_path:
-                # Use specified Chrome driver path
-                service = Service(executable_path=chrome_driver_path)
-                driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            else:
-                # Use ChromeDriverManager to automatically download and manage the driver
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=self.chrome_options)
-                
-            driver.get(job_data.get('link', ''))
             
-            print(f"\nOpening application page for {job_data.get('title', 'Unknown')} at {job_data.get('company', 'Unknown')}")
-            print("Please complete the application manually.")
-            print(f"Use the cover letter saved at: {cover_letter_path}")
-            print(f"Use the resume at: {self.resume_path}")
+        return self._drive_application(job_data, cover_letter_path, interactive)
+        
+    def _prepare_application(self, job_data):
+        """
+        Generate and save the cover letter for a job application.
+        
+        Args:
+            job_data (dict): Job data
             
-            # Wait for manual completion
-            input("\nPress Enter when you have completed the application or want to exit...")
+        Returns:
+            str: Path to saved cover letter file, or None if saving failed
+        """
+        cover_letter = self.generate_cover_letter(job_data)
+        return self.save_cover_letter(job_data, cover_letter)
+        
+    def _drive_application(self, job_data, cover_letter_path, interactive=False):
+        """
+        Open the application page for a job and wait for it to be completed.
+        
+        Args:
+            job_data (dict): Job data
+            cover_letter_path (str): Path to the saved cover letter
+            interactive (bool): Wait for the user to press Enter
             
-            # Log the application
-            job_id = f"{job_data.get('company', '')}_{job_data.get('title', '')}"
-            self.applied_jobs[job_id] = {
-                'title': job_data.get('title', 'Unknown'),
-                'company': job_data.get('company', 'Unknown'),
-                'link': job_data.get('link', ''),
-                'applied_date': time.strftime("%Y-%m-%d %H:%M:%S")
-            }
-            self._save_applied_jobs()
+        Returns:
+            bool: True if application successful, False otherwise
+        """
+        title = job_data.get('title', 'Unknown')
+        company = job_data.get('company', 'Unknown')
+        
+        try:
+            with self.pool.acquire() as driver:
+                driver.get(job_data.get('link', ''))
+                
+                print(f"\nOpening application page for {title} at {company}")
+                print("Please complete the application manually.")
+                print(f"Use the cover letter saved at: {cover_letter_path}")
+                print(f"Use the resume at: {self.resume_path}")
+                
+                if interactive:
+                    # Wait for manual completion
+                    input("\nPress Enter when you have completed the application or want to exit...")
+                elif not self._wait_for_submission(driver, job_data.get('source', ''), self.application_timeout):
+                    logger.warning(f"Application to {company} was not submitted in time")
+                    return False
+                    
+            self._record_application(job_data)
             
-            logger.info(f"Application to {job_data.get('company', '')} completed")
-            driver.quit()
+            logger.info(f"Application to {company} completed")
             return True
         
         except Exception as e:
             logger.error(f"Error applying to job: {e}", exc_info=True)
-            if 'driver' in locals():
-                driver.quit()
             return False
+            
+    def _wait_for_submission(self, driver, source, timeout=300):
+        """
+        Wait until the browser shows that an application has been submitted.
+        
+        Args:
+            driver: WebDriver showing the application page
+            source (str): Job source, used to pick the site's submission markers
+            timeout (int): Seconds to wait before giving up
+            
+        Returns:
+            bool: True if the application was submitted, False on timeout
+        """
+        conditions = []
+        for markers in (Constants.SUBMIT_SELECTORS.get(source), Constants.SUBMIT_SELECTORS['generic']):
+            if markers:
+                conditions.append(EC.url_contains(markers['url_contains']))
+                conditions.append(EC.presence_of_element_located((By.CSS_SELECTOR, markers['css'])))
+                
+        try:
+            WebDriverWait(driver, timeout).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
+            return False
+            
+    def _record_application(self, job_data):
+        """
+        Record a completed application in the applications database.
+        
+        Args:
+            job_data (dict): Job data
+        """
+        title = job_data.get('title')
+        company = job_data.get('company')
+        job_id = self._job_id(job_data)
+        application = {
+            'title': title or 'Unknown',
+            'company': company or 'Unknown',
+            'link': job_data.get('link', ''),
+            'applied_date': time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        with self._applied_lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO applications (job_id, company, title, link, applied_date) VALUES (?, ?, ?, ?, ?)',
+                (job_id, application['company'], application['title'], application['link'], application['applied_date'])
+            )
     
     def get_applied_job_stats(self):
         """
@@ -407,23 +785,24 @@ Sincerely,
         Returns:
             dict: Statistics about applied jobs
         """
-        total_applied = len(self.applied_jobs)
-        
-        # Count by company
-        company_counts = {}
-        for job_id, job_data in self.applied_jobs.items():
-            company = job_data.get('company', 'Unknown')
-            company_counts[company] = company_counts.get(company, 0) + 1
+        with self._applied_lock:
+            # Count by company and day with a single scan of the table
+            rows = self._db.execute('''
+                SELECT company, date(applied_date), COUNT(*) FROM applications
+                GROUP BY 1, 2
+            ''').fetchall()
+            
+        company_counts = Counter()
+        date_counts = Counter()
+        for company, date, count in rows:
+            company_counts[company] += count
+            if date:
+                date_counts[date] += count
+                
+        total_applied = sum(company_counts.values())
         
         # Get top companies
-        top_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        # Get application dates
-        dates = [job_data.get('applied_date', '').split(' ')[0] for job_data in self.applied_jobs.values()]
-        date_counts = {}
-        for date in dates:
-            if date:
-                date_counts[date] = date_counts.get(date, 0) + 1
+        top_companies = company_counts.most_common(5)
         
         # Sort by date
         application_trend = sorted(date_counts.items())
@@ -434,32 +813,43 @@ Sincerely,
             'application_trend': application_trend
         }
     
-    def show_applied_jobs(self):
-        """Show list of applied jobs."""
-        if not self.applied_jobs:
+    def show_applied_jobs(self, limit=20):
+        """
+        Show list of the most recently applied jobs.
+        
+        Args:
+            limit (int): Maximum number of applications to list
+        """
+        stats = self.get_applied_job_stats()
+        if not stats['total_applied']:
             print("\nYou haven't applied to any jobs yet.")
             return
         
-        print("\n" + "="*60)
-        print(f"Applied Jobs: {len(self.applied_jobs)}")
-        print("="*60)
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append(f"Applied Jobs: {stats['total_applied']}")
+        lines.append("="*60)
+        
+        with self._applied_lock:
+            recent = self._db.execute('''
+                SELECT title, company, link, applied_date FROM applications
+                ORDER BY applied_date DESC LIMIT ?
+            ''', (limit,)).fetchall()
         
-        for i, (job_id, job_data) in enumerate(sorted(self.applied_jobs.items(), 
-                                                    key=lambda x: x[1].get('applied_date', ''), 
-                                                    reverse=True), 1):
-            print(f"{i}. {job_data.get('title', 'Unknown')} at {job_data.get('company', 'Unknown')}")
-            print(f"   Applied on: {job_data.get('applied_date', 'Unknown date')}")
-            print(f"   Link: {job_data.get('link', 'No link')}")
-            print()
+        for i, (title, company, link, applied_date) in enumerate(recent, 1):
+            lines.append(f"{i}. {title or 'Unknown'} at {company or 'Unknown'}")
+            lines.append(f"   Applied on: {applied_date or 'Unknown date'}")
+            lines.append(f"   Link: {link or 'No link'}")
+            lines.append("")
         
         # Show statistics
-        stats = self.get_applied_job_stats()
-        print("\nApplication Statistics:")
-        print(f"Total applications: {stats['total_applied']}")
+        lines.append("\nApplication Statistics:")
+        lines.append(f"Total applications: {stats['total_applied']}")
         
         if stats['top_companies']:
-            print("\nTop companies:")
+            lines.append("\nTop companies:")
             for company, count in stats['top_companies']:
-                print(f"- {company}: {count} applications")
+                lines.append(f"- {company}: {count} applications")
         
-        print("="*60 + "\n") 
\ No newline at end of file
+        lines.append("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -2,21 +2,79 @@
 Utility functions for the job scraper application.
 """
 
+import atexit
 import hashlib
 import os
+import queue
 import re
+import tempfile
+import time
+import threading
 import urllib.robotparser
+from urllib.parse import urlsplit
 import logging
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from cryptography.fernet import Fernet
 from selenium.common.exceptions import NoSuchElementException
-from typing import Dict, List, Union, Optional
-from datetime import datetime
-from pathlib import Path
+from typing import Collection, Dict, List, Union, Optional
+from datetime import date
 
 from ..config.constants import Constants
 
 logger = logging.getLogger(__name__)
 
+# Flag to track if rfernet is available
+RFERNET_AVAILABLE = False
+
+try:
+    import rfernet
+    RFERNET_AVAILABLE = True
+except ImportError:
+    logger.debug("rfernet is not available. Encryption will use cryptography's Fernet. Install with: pip install rfernet")
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(Constants.PATTERNS["email"])
+_PHONE_RE = re.compile(Constants.PATTERNS["phone"])
+_NAME_RE = re.compile(Constants.PATTERNS["name"])
+_API_KEY_RE = re.compile(Constants.PATTERNS["api_key"])
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+
+# Translation table deleting the ASCII characters _FILENAME_UNSAFE_RE removes
+_FILENAME_ASCII_TABLE = {c: None for c in range(128) if _FILENAME_UNSAFE_RE.match(chr(c))}
+
+# Reads the text of several elements in one round-trip; null marks a missing element
+_TEXT_BATCH_JS = (
+    "const root = arguments[1] || document;"
+    "return arguments[0].map(s => { const e = root.querySelector(s); return e ? e.innerText.trim() : null; });"
+)
+
+# Directories user-supplied file paths must stay within, as absolute path prefixes
+_ALLOWED_DIRS = tuple(
+    os.path.join(os.path.abspath(directory), '')
+    for directory in (Constants.APP_DIR, Constants.COVER_LETTERS_DIR, Constants.APPLICATION_LOGS_DIR)
+)
+
+# Parsed robots.txt files per domain, with the time they were fetched
+_ROBOTS_CACHE: Dict[str, tuple] = {}
+_ROBOTS_TTL = 3600  # 1 hour in seconds
+_robots_lock = threading.Lock()
+
+# Background thread writing queued log records, started by setup_logging
+_log_listener: Optional[QueueListener] = None
+
+# Size of the memo caches on the string validators
+_VALIDATION_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=8)
+def _fernet_for(key: Union[bytes, str]):
+    """Return a Fernet cipher for a key, built once per key."""
+    if RFERNET_AVAILABLE:
+        # rfernet produces the same tokens but only accepts str keys
+        return rfernet.Fernet(key.decode() if isinstance(key, bytes) else key)
+    return Fernet(key)
+
 class Utils:
     """Utility functions used throughout the application."""
     
@@ -28,36 +86,57 @@ class Utils:
     @staticmethod
     def get_or_create_key(key_file="secret.key"):
         """Get existing key or create a new one"""
-        if os.path.exists(key_file):
-            with open(key_file, "rb") as file:
-                key = file.read()
-        else:
-            key = Utils.generate_encryption_key()
-            with open(key_file, "wb") as file:
-                file.write(key)
+        try:
+            with open(key_file, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+            
+        # Write the key to a private temp file next to the target, then link it
+        # into place, so the key file never exists without its contents
+        key = Utils.generate_encryption_key()
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(key_file)))
+        try:
+            try:
+                os.write(fd, key)
+            finally:
+                os.close(fd)
+            os.link(tmp_path, key_file)
+        except FileExistsError:
+            # Another process created the key first, use theirs
+            with open(key_file, 'rb') as f:
+                return f.read()
+        finally:
+            os.unlink(tmp_path)
         return key
     
     @staticmethod
     def encrypt_data(data, key):
         """Encrypt data using Fernet symmetric encryption"""
-        f = Fernet(key)
-        return f.encrypt(data.encode()).decode()
+        token = _fernet_for(key).encrypt(data.encode())
+        # rfernet returns the token as str, cryptography as bytes
+        return token if isinstance(token, str) else token.decode()
     
     @staticmethod
     def decrypt_data(encrypted_data, key):
         """Decrypt data using Fernet symmetric encryption"""
-        f = Fernet(key)
-        return f.decrypt(encrypted_data.encode()).decode()
+        token = encrypted_data if RFERNET_AVAILABLE else encrypted_data.encode()
+        return _fernet_for(key).decrypt(token).decode()
     
     @staticmethod
     def hash_identifier(text):
-        """Create a secure hash of an identifier"""
-        return hashlib.sha256(text.encode()).hexdigest()
+        """Create a secure hash of an identifier, given as str or bytes"""
+        data = text if isinstance(text, (bytes, bytearray)) else text.encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
     
     @staticmethod
     def sanitize_filename(filename):
         """Sanitize a string to be used as a filename"""
-        return re.sub(r'[^\w\s-]', '', filename).strip().replace(' ', '_')
+        if filename.isascii():
+            cleaned = filename.translate(_FILENAME_ASCII_TABLE)
+        else:
+            cleaned = _FILENAME_UNSAFE_RE.sub('', filename)
+        return cleaned.strip().replace(' ', '_')
     
     @staticmethod
     def safe_get_element_text(driver, by, selector, default=""):
@@ -69,84 +148,154 @@ class Utils:
             return default
     
     @staticmethod
-    def check_robots_txt(domain):
-        """Check if scraping is allowed for a domain"""
-        rp = urllib.robotparser.RobotFileParser()
-        rp.set_url(f"https://{domain}/robots.txt")
-        try:
-            rp.read()
-            return rp.can_fetch("*", f"https://{domain}/")
-        except Exception as e:
-            logger.warning(f"Could not check robots.txt for {domain}: {e}")
-            return True  # Assume allowed if we can't check
+    def safe_get_many(driver, selectors, root=None, defaults=None):
+        """Get the text of several elements in a single browser round-trip
+        
+        Args:
+            driver: WebDriver to run the lookup in.
+            selectors (dict): Maps result keys to CSS selectors.
+            root: Optional element to search within instead of the whole page.
+            defaults (dict, optional): Per-key fallback used when an element is missing.
+            
+        Returns:
+            dict: Each key mapped to its element's stripped text or its default.
+        """
+        defaults = defaults or {}
+        keys = list(selectors)
+        texts = driver.execute_script(_TEXT_BATCH_JS, [selectors[key] for key in keys], root)
+        return {
+            key: defaults.get(key, "") if text is None else text
+            for key, text in zip(keys, texts)
+        }
+    
+    @staticmethod
+    def check_robots_txt(domain, user_agent="*"):
+        """Check if scraping is allowed for a domain
+        
+        Parsed robots.txt files are shared per domain for an hour, so
+        rule changes are picked up in long sessions. Failed fetches are
+        not cached and are retried on the next check.
+        
+        Args:
+            domain (str): Domain to check.
+            user_agent (str): User agent whose rules apply.
+            
+        Returns:
+            bool: True if allowed or robots.txt could not be read.
+        """
+        with _robots_lock:
+            cached = _ROBOTS_CACHE.get(domain)
+            
+        if cached and time.time() - cached[0] < _ROBOTS_TTL:
+            rp = cached[1]
+        else:
+            rp = urllib.robotparser.RobotFileParser()
+            rp.set_url(f"https://{domain}/robots.txt")
+            try:
+                rp.read()
+            except Exception as e:
+                logger.warning(f"Could not check robots.txt for {domain}: {e}")
+                return True  # Assume allowed if we can't check
+                
+            with _robots_lock:
+                _ROBOTS_CACHE[domain] = (time.time(), rp)
+                
+        return rp.can_fetch(user_agent, f"https://{domain}/")
     
     @staticmethod
     def setup_logging(log_file="job_scraper.log", level=logging.INFO):
-        """Set up logging configuration"""
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        ) 
+        """Set up logging configuration
+        
+        Records are queued and written to the log file and console by a
+        listener thread, so logging calls never wait on disk I/O. Like
+        logging.basicConfig, this does nothing if the root logger already
+        has handlers.
+        """
+        global _log_listener
+        
+        root = logging.getLogger()
+        if root.handlers:
+            return
+            
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        _log_listener.start()
+        # Drain the queue before the interpreter exits
+        atexit.register(_log_listener.stop)
+        
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(level)
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_email(email: str) -> bool:
     """Validate email address format."""
     if not email:
         return False
-    pattern = Constants.PATTERNS["email"]
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.fullmatch(email))
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_phone(phone: str) -> bool:
     """Validate phone number format."""
     if not phone:
         return False
-    pattern = Constants.PATTERNS["phone"]
-    return bool(re.match(pattern, phone))
+    return bool(_PHONE_RE.fullmatch(phone))
 
 def validate_name(name: str) -> bool:
     """Validate name format."""
     if not name:
         return False
-    pattern = Constants.PATTERNS["name"]
-    return bool(re.match(pattern, name))
+    return bool(_NAME_RE.fullmatch(name))
 
-def validate_file_path(file_path: str, required_extensions: Optional[List[str]] = None) -> bool:
+def validate_file_path(file_path: str, required_extensions: Optional[Collection[str]] = None) -> bool:
     """Validate file path and extension."""
     if not file_path:
         return False
         
     try:
-        path = Path(file_path)
-        if not path.exists():
+        if not os.path.isfile(file_path):
             return False
             
         if required_extensions:
-            return path.suffix.lower() in required_extensions
+            return os.path.splitext(file_path)[1].lower() in required_extensions
             
         return True
     except Exception:
         return False
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_url(url: str) -> bool:
     """Validate URL format."""
-    if not url:
+    if not url or ' ' in url or not url.isprintable():
+        return False
+    try:
+        parts = urlsplit(url)
+        # Raises for a non-numeric or out of range port
+        parts.port
+    except ValueError:
+        # Malformed netloc, such as an unbalanced IPv6 bracket
         return False
-    pattern = r'^https?://(?:[\w-]+\.)+[\w-]+(?:/[\w-./?%&=]*)?$'
-    return bool(re.match(pattern, url))
+    hostname = parts.hostname
+    if parts.scheme not in ('http', 'https') or not hostname or '.' not in hostname:
+        return False
+    # Every dot-separated label must be non-empty
+    return all(hostname.split('.'))
 
 def validate_date(date_str: str) -> bool:
     """Validate date format (YYYY-MM-DD)."""
-    if not date_str:
+    if not date_str or not _DATE_RE.fullmatch(date_str):
         return False
     try:
-        datetime.strptime(date_str, '%Y-%m-%d')
+        date.fromisoformat(date_str)
         return True
     except ValueError:
         return False
@@ -154,57 +303,64 @@ def validate_date(date_str: str) -> bool:
 def validate_user_info(user_info: Dict) -> List[str]:
     """Validate user information."""
     errors = []
+    get = user_info.get
+    append = errors.append
     
-    if not validate_name(user_info.get('name', '')):
-        errors.append("Invalid name format")
+    if not validate_name(get('name', '')):
+        append("Invalid name format")
         
-    if not validate_email(user_info.get('email', '')):
-        errors.append("Invalid email format")
+    if not validate_email(get('email', '')):
+        append("Invalid email format")
         
-    if not validate_phone(user_info.get('phone', '')):
-        errors.append("Invalid phone number format")
+    if not validate_phone(get('phone', '')):
+        append("Invalid phone number format")
         
-    if not user_info.get('location'):
-        errors.append("Location is required")
+    if not get('location'):
+        append("Location is required")
         
-    if not user_info.get('skills'):
-        errors.append("At least one skill is required")
+    if not get('skills'):
+        append("At least one skill is required")
         
     return errors
 
 def validate_job_data(job_data: Dict) -> List[str]:
     """Validate job data."""
     errors = []
+    get = job_data.get
+    append = errors.append
     
-    if not job_data.get('title'):
-        errors.append("Job title is required")
+    if not get('title'):
+        append("Job title is required")
         
-    if not job_data.get('company'):
-        errors.append("Company name is required")
+    if not get('company'):
+        append("Company name is required")
         
-    if not validate_url(job_data.get('url', '')):
-        errors.append("Invalid job URL")
+    if not validate_url(get('url', '')):
+        append("Invalid job URL")
         
-    if not job_data.get('description'):
-        errors.append("Job description is required")
+    if not get('description'):
+        append("Job description is required")
         
-    if job_data.get('deadline') and not validate_date(job_data['deadline']):
-        errors.append("Invalid deadline date format")
+    deadline = get('deadline')
+    if deadline and not validate_date(deadline):
+        append("Invalid deadline date format")
         
     return errors
 
 def validate_resume_data(resume_data: Dict) -> List[str]:
     """Validate resume data."""
     errors = []
+    get = resume_data.get
+    append = errors.append
     
-    if not resume_data.get('skills'):
-        errors.append("At least one skill is required")
+    if not get('skills'):
+        append("At least one skill is required")
         
-    if not resume_data.get('experience'):
-        errors.append("At least one work experience is required")
+    if not get('experience'):
+        append("At least one work experience is required")
         
-    if not resume_data.get('education'):
-        errors.append("At least one education entry is required")
+    if not get('education'):
+        append("At least one education entry is required")
         
     return errors
 
@@ -215,16 +371,9 @@ def sanitize_file_path(file_path: str) -> str:
         abs_path = os.path.abspath(file_path)
         
         # Check if path is within allowed directories
-        allowed_dirs = [
-            Constants.APP_DIR,
-            Constants.COVER_LETTER_DIR,
-            Constants.APPLICATION_LOG_DIR
-        ]
-        
-        for allowed_dir in allowed_dirs:
-            if abs_path.startswith(allowed_dir):
-                return abs_path
-                
+        if abs_path.startswith(_ALLOWED_DIRS):
+            return abs_path
+            
         raise ValidationError("File path is outside allowed directories")
         
     except Exception as e:
@@ -233,41 +382,46 @@ def sanitize_file_path(file_path: str) -> str:
 def validate_config(config: Dict) -> List[str]:
     """Validate application configuration."""
     errors = []
+    get = config.get
+    append = errors.append
     
     # Validate user info
-    if 'user_info' in config:
-        errors.extend(validate_user_info(config['user_info']))
+    user_info = get('user_info')
+    if user_info is not None:
+        errors.extend(validate_user_info(user_info))
         
     # Validate job scraper settings
-    if 'job_scraper' in config:
-        scraper_config = config['job_scraper']
+    scraper_config = get('job_scraper')
+    if scraper_config is not None:
         if not scraper_config.get('keywords'):
-            errors.append("At least one search keyword is required")
+            append("At least one search keyword is required")
         if not scraper_config.get('location'):
-            errors.append("Search location is required")
+            append("Search location is required")
             
     # Validate resume settings
-    if 'resume' in config:
-        resume_config = config['resume']
-        if resume_config.get('default_resume'):
-            if not validate_file_path(resume_config['default_resume'], Constants.FILE_EXTENSIONS['RESUME']):
-                errors.append("Invalid default resume file path")
+    resume_config = get('resume')
+    if resume_config is not None:
+        default_resume = resume_config.get('default_resume')
+        if default_resume:
+            if not validate_file_path(default_resume, Constants.FILE_EXTENSIONS['RESUME']):
+                append("Invalid default resume file path")
                 
     # Validate application settings
-    if 'application' in config:
-        app_config = config['application']
-        if app_config.get('default_cover_letter_template'):
-            if not validate_file_path(app_config['default_cover_letter_template'], Constants.FILE_EXTENSIONS['COVER_LETTER']):
-                errors.append("Invalid cover letter template file path")
+    app_config = get('application')
+    if app_config is not None:
+        template_path = app_config.get('default_cover_letter_template')
+        if template_path:
+            if not validate_file_path(template_path, Constants.FILE_EXTENSIONS['COVER_LETTER']):
+                append("Invalid cover letter template file path")
                 
     return errors
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_api_key(api_key: str) -> bool:
     """Validate OpenAI API key format."""
     if not api_key:
         return False
-    pattern = r'^sk-[a-zA-Z0-9]{32,}$'
-    return bool(re.match(pattern, api_key))
+    return bool(_API_KEY_RE.fullmatch(api_key))
 
 def validate_match_percentage(percentage: Union[int, float]) -> bool:
     """Validate job match percentage."""
@@ -7,7 +7,4 @@ import sys
 from job_scraper.main import main
 
 if __name__ == "__main__":
-    # Add headless flag if not explicitly provided
-    if "--headless" not in sys.argv:
-        sys.argv.append("--headless")
-    sys.exit(main())    
\ No newline at end of file
+    sys.exit(main(headless=True))    
\ No newline at end of file
@@ -2,9 +2,12 @@ import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 
-# Make sure we have the necessary NLTK data
-nltk.download('punkt')
-nltk.download('stopwords')
+# Make sure we have the necessary NLTK data, downloading only what is missing
+for resource, package in (('tokenizers/punkt', 'punkt'), ('corpora/stopwords', 'stopwords')):
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        nltk.download(package)
 
 # Test word tokenization
 text = "Hello there! This is a test of NLTK. Are you working properly? I hope so."